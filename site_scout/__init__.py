@@ -7,5 +7,35 @@
 
 __version__ = "0.1.0"
 
-# Публичные импорты
-# (если понадобятся — сюда можно добавлять через __all__)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .aggregator import (
+        DocumentInfo,
+        HiddenResourceInfo,
+        PageInfo,
+        ScanReport,
+        aggregate_results,
+    )
+
+__all__ = [
+    "__version__",
+    "DocumentInfo",
+    "HiddenResourceInfo",
+    "PageInfo",
+    "ScanReport",
+    "aggregate_results",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Ленивый реэкспорт (PEP 562): агрегатор грузится при первом обращении.
+
+    Так ``import site_scout.cli`` (и ``--version``) не тянет за собой агрегатор
+    с его сериализаторами.
+    """
+    if name in __all__:
+        from . import aggregator
+
+        return getattr(aggregator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,25 @@
 
 from __future__ import annotations
 
+import io
 import json
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, TypedDict, Union
+from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, TextIO, Tuple, TypedDict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+__all__ = [
+    "PageInfo",
+    "DocumentInfo",
+    "HiddenResourceInfo",
+    "ScanReport",
+    "aggregate_results",
+]
 
 
 class PageInfo(TypedDict, total=False):
@@ -36,7 +52,8 @@ class HiddenResourceInfo(TypedDict, total=False):
     size: int
 
 
-@dataclass(slots=True)
+# eq/repr отключены: сгенерированные методы обходят все страницы и документы отчёта.
+@dataclass(slots=True, eq=False, repr=False)
 class ScanReport:
     """Результаты сканирования сайта, включая страницы, документы и скрытые ресурсы."""
 
@@ -47,116 +64,161 @@ class ScanReport:
 
     raw_results: Union[List[Any], None] = None
 
+    def _payload(self) -> Dict[str, Any]:
+        """Публичная часть отчёта (без raw_results) для сериализации."""
+        return {
+            "pages": self.pages,
+            "documents": self.documents,
+            "hidden_resources": self.hidden_resources,
+            "locales": self.locales,
+        }
+
     def json(self, *, pretty: bool = False) -> str:
         """Возвращает JSON-представление ScanReport без сырых данных."""
-        output = {k: v for k, v in asdict(self).items() if k != "raw_results"}
-        return json.dumps(output, ensure_ascii=False, indent=2 if pretty else None)
+        return _dumps(self._payload(), pretty=pretty)
+
+    def write_json(self, fp: TextIO, *, pretty: bool = False) -> None:
+        """Пишет JSON-представление отчёта прямо в открытый текстовый файл.
+
+        С orjson байты UTF-8 уходят в бинарный буфер файла (``fp.buffer``) без
+        декодирования в str; без orjson json.dump пишет в файл по частям.
+        """
+        if orjson is None:
+            json.dump(self._payload(), fp, ensure_ascii=False, indent=2 if pretty else None)
+            return
+        data = _orjson_dumps(self._payload(), pretty=pretty)
+        buffer = getattr(fp, "buffer", None)
+        encoding = (getattr(fp, "encoding", None) or "").lower().replace("-", "")
+        if buffer is None or encoding != "utf8":
+            fp.write(data.decode("utf-8"))  # StringIO или файл в другой кодировке
+            return
+        fp.flush()
+        buffer.write(data)
+
+    def write_html(self, fp: TextIO) -> None:
+        """Пишет простую HTML-обёртку с JSON отчёта в открытый файл без промежуточной строки."""
+        fp.write("<html><body><pre>")
+        self.write_json(fp, pretty=True)
+        fp.write("</pre></body></html>")
 
     def generate_html(self) -> str:
         """Генерирует простую HTML для CLI или тестов."""
-        return f"<html><body><pre>{self.json(pretty=True)}</pre></body></html>"
+        buf = io.StringIO()
+        self.write_html(buf)
+        return buf.getvalue()
+
+
+def _orjson_dumps(payload: Any, *, pretty: bool = False) -> bytes:
+    """Сериализует payload в байты JSON через orjson (должен быть установлен)."""
+    opts = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    return orjson.dumps(payload, option=opts)
+
+
+def _dumps(payload: Any, *, pretty: bool = False) -> str:
+    """Сериализует payload в JSON через orjson, если он установлен, иначе через json."""
+    if orjson is not None:
+        return _orjson_dumps(payload, pretty=pretty).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2 if pretty else None)
+
+
+def _getter(obj: Any) -> Callable[[str, Any], Any]:
+    """Возвращает функцию чтения полей obj, выбранную один раз по типу объекта."""
+    if isinstance(obj, dict):
+        return obj.get
+    return partial(getattr, obj)
+
+
+_PARSED_FIELDS = attrgetter("links", "meta", "headings", "headers")
+
+
+def _parsed_fields(parsed: Any) -> Tuple[Any, Any, Any, Any]:
+    """Возвращает (links, meta, headings, headers) результата парсинга.
+
+    Все четыре атрибута читаются одним C-вызовом ``attrgetter``; если какого-то
+    нет, недостающие берутся через getattr со значениями по умолчанию. Как и
+    getattr, учитываются атрибуты класса, свойства и ``__slots__``.
+    """
+    try:
+        return _PARSED_FIELDS(parsed)
+    except AttributeError:
+        return (
+            getattr(parsed, "links", []),
+            getattr(parsed, "meta", {}),
+            getattr(parsed, "headings", {}),
+            getattr(parsed, "headers", {}),
+        )
 
 
 def _aggregate_pages(raw_results: List[Any]) -> List[PageInfo]:
     """Преобразует страницы из сырых данных."""
     pages: List[PageInfo] = []
+    append = pages.append
     for entry in raw_results:
-        url = entry.get("url", "") if isinstance(entry, dict) else getattr(entry, "url", "")
-        parsed = (
-            entry.get("parsed", None) if isinstance(entry, dict) else getattr(entry, "parsed", None)
-        )
-        pages.append(
+        get = _getter(entry)
+        parsed = get("parsed", None)
+        links, meta, headings, headers = _parsed_fields(parsed) if parsed else ([], {}, {}, {})
+        append(
             {
-                "url": url,
-                "links": getattr(parsed, "links", []) if parsed else [],
-                "meta": getattr(parsed, "meta", {}) if parsed else {},
-                "headings": getattr(parsed, "headings", {}) if parsed else {},
-                "headers": getattr(parsed, "headers", {}) if parsed else {},
+                "url": get("url", ""),
+                "links": links,
+                "meta": meta,
+                "headings": headings,
+                "headers": headers,
             }
         )
     return pages
 
 
+def _document_info(doc: Any) -> DocumentInfo:
+    """Строит запись DocumentInfo из dict или объекта документа."""
+    get = _getter(doc)
+    return {
+        "name": get("name", ""),
+        "url": get("url", ""),
+        "size": get("size", 0),
+        "mime": get("mime", ""),
+    }
+
+
+def _hidden_info(hr: Any) -> HiddenResourceInfo:
+    """Строит запись HiddenResourceInfo из dict или объекта скрытого ресурса."""
+    get = _getter(hr)
+    return {
+        "url": get("url", ""),
+        "status": get("status", None),
+        "type": get("content_type", ""),
+        "size": get("size", 0),
+    }
+
+
 def _aggregate_documents(raw_results: List[Any]) -> List[DocumentInfo]:
     """Преобразует документы из сырых данных."""
-    docs_list: List[DocumentInfo] = []
-    for entry in raw_results:
-        docs = (
-            entry.get("documents", [])
-            if isinstance(entry, dict)
-            else getattr(entry, "documents", [])
-        )
-        for doc in docs:
-            docs_list.append(
-                {
-                    "name": (
-                        getattr(doc, "name", "")
-                        if not isinstance(doc, dict)
-                        else doc.get("name", "")
-                    ),
-                    "url": (
-                        getattr(doc, "url", "") if not isinstance(doc, dict) else doc.get("url", "")
-                    ),
-                    "size": (
-                        getattr(doc, "size", 0) if not isinstance(doc, dict) else doc.get("size", 0)
-                    ),
-                    "mime": (
-                        getattr(doc, "mime", "")
-                        if not isinstance(doc, dict)
-                        else doc.get("mime", "")
-                    ),
-                }
-            )
-    return docs_list
+    return [_document_info(doc) for entry in raw_results for doc in _getter(entry)("documents", [])]
 
 
 def _aggregate_hidden(raw_results: List[Any]) -> List[HiddenResourceInfo]:
     """Преобразует скрытые ресурсы из сырых данных."""
-    hidden_list: List[HiddenResourceInfo] = []
-    for entry in raw_results:
-        hrs = (
-            entry.get("hidden_paths", [])
-            if isinstance(entry, dict)
-            else getattr(entry, "hidden_paths", [])
-        )
-        for hr in hrs:
-            hidden_list.append(
-                {
-                    "url": (
-                        getattr(hr, "url", "") if not isinstance(hr, dict) else hr.get("url", "")
-                    ),
-                    "status": (
-                        getattr(hr, "status", None)
-                        if not isinstance(hr, dict)
-                        else hr.get("status")
-                    ),
-                    "type": (
-                        getattr(hr, "content_type", "")
-                        if not isinstance(hr, dict)
-                        else hr.get("content_type", "")
-                    ),
-                    "size": (
-                        getattr(hr, "size", 0) if not isinstance(hr, dict) else hr.get("size", 0)
-                    ),
-                }
-            )
-    return hidden_list
-
-
-def aggregate_results(raw_results: List[Any]) -> ScanReport:
-    """Собирает все части отчёта в ScanReport."""
-    report = ScanReport(raw_results=raw_results)
+    return [_hidden_info(hr) for entry in raw_results for hr in _getter(entry)("hidden_paths", [])]
+
+
+def aggregate_results(raw_results: List[Any], *, keep_raw: bool = False) -> ScanReport:
+    """Собирает все части отчёта в ScanReport.
+
+    Сырые данные сохраняются в ``report.raw_results`` только при ``keep_raw=True``;
+    по умолчанию отчёт не удерживает их, и память освобождается сразу после агрегации.
+    """
+    report = ScanReport(raw_results=raw_results if keep_raw else None)
     report.pages = _aggregate_pages(raw_results)
     report.documents = _aggregate_documents(raw_results)
     report.hidden_resources = _aggregate_hidden(raw_results)
     # Обработка локалей
     if raw_results:
-        last = raw_results[-1]
-        locales_raw = (
-            last.get("locales", {}) if isinstance(last, dict) else getattr(last, "locales", {})
-        )
+        locales_raw = _getter(raw_results[-1])("locales", {})
         if isinstance(locales_raw, dict):
-            report.locales = {
-                lang: sorted(urls) for lang, urls in locales_raw.items() if isinstance(urls, list)
-            }
+            for lang, urls in locales_raw.items():
+                if isinstance(urls, (list, set, tuple)):
+                    # Timsort на уже упорядоченном списке (BFS-порядок) работает за O(n).
+                    ordered = list(urls)
+                    ordered.sort()
+                    report.locales[lang] = ordered
     return report
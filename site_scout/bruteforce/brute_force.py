@@ -1,9 +1,14 @@
 """Модуль для перебора скрытых директорий на сайте."""
 
 import asyncio
+import hashlib
 import logging
+import re
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Union
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Tuple, Union
+from uuid import uuid4
 
 import aiohttp
 
@@ -12,53 +17,330 @@ from site_scout.utils import normalize_url, read_wordlist
 logger = logging.getLogger(__name__)
 
 
+# Символы, при которых склейка base/word не эквивалентна normalize_url
+# (query, fragment, params, пробельные символы, которые вырезает urlparse).
+_NEEDS_NORMALIZE = re.compile(r"[?#;\s]")
+
+
+def _build_urls(base_url: str, words: List[str]) -> List[str]:
+    """Строит уникальные нормализованные URL ``base_url/word`` для всего словаря.
+
+    Слеши на стыке base_url и слова схлопываются, дубликаты отбрасываются с
+    сохранением порядка. Результат совпадает с ``normalize_url`` от склеенной
+    строки, но для обычных слов обходится конкатенацией без urlparse на каждое слово.
+    """
+    prefix = base_url.rstrip("/") + "/"
+    if _NEEDS_NORMALIZE.search(base_url) or not base_url.startswith(("http://", "https://")):
+        return list(dict.fromkeys(normalize_url(prefix + word.lstrip("/")) for word in words))
+
+    urls: List[str] = []
+    append = urls.append
+    for word in words:
+        url = prefix + word.lstrip("/")
+        if _NEEDS_NORMALIZE.search(word):
+            append(normalize_url(url))
+            continue
+        if not url.endswith("/"):
+            name = url.rpartition("/")[2]
+            if name == ".":
+                append(normalize_url(url))
+                continue
+            dot = name.rfind(".")
+            if not 0 < dot < len(name) - 1:
+                url += "/"
+        append(url)
+    return list(dict.fromkeys(urls))
+
+
+@dataclass(slots=True, frozen=True)
 class HiddenResource:
-    """Результат поиска скрытого ресурса."""
+    """Результат поиска скрытого ресурса.
+
+    Поля content_type и size читаются агрегатором отчёта; они заполняются из
+    заголовков ответа на пробный запрос (размер — по Content-Range/Content-Length;
+    None, если сервер его не сообщил, например при chunked-ответе). Для редиректов
+    в location сохраняется цель из заголовка Location — без повторного запроса по ней.
+    """
+
+    url: str
+    status: int
+    content_type: str = ""
+    size: Optional[int] = None
+    location: str = ""
+
+
+def _response_size(response: aiohttp.ClientResponse) -> Optional[int]:
+    """Полный размер ресурса: из Content-Range для Range-запроса, иначе Content-Length.
 
-    def __init__(self, url: str, status: int) -> None:
-        """Инициализирует скрытый ресурс с URL и HTTP-статусом."""
-        self.url: str = url
-        self.status: int = status
+    None — размер неизвестен (chunked-ответ без обоих заголовков).
+    """
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    if total.isdigit():
+        return int(total)
+    return response.content_length
 
-    def __repr__(self) -> str:
-        """Строковое представление объекта HiddenResource для отладки."""
-        return f"<HiddenResource url={self.url} status={self.status}>"
+
+#: Базовая линия «мягкого 404»: ответ на случайный путь и хэш начала его тела
+#: (хэш снимается, только если размер ответа неизвестен).
+_Soft404 = Tuple[HiddenResource, Optional[bytes]]
 
 
 class BruteForcer:
     """Класс для поиска скрытых директорий на сайте."""
 
+    _HEAD_FALLBACK_STATUS: Tuple[int, ...] = (405, 501)
+    # Статусы, означающие, что путь существует: успешные (206 — ответ на Range-GET),
+    # редиректы (обычно на каталог со слешем или логин) и закрытые (401/403).
+    _INTERESTING_STATUS: FrozenSet[int] = frozenset({200, 204, 206, 301, 302, 307, 308, 401, 403})
+    _REDIRECT_STATUS: FrozenSet[int] = frozenset({301, 302, 303, 307, 308})
+    _RANGE_HEADERS: Dict[str, str] = {"Range": "bytes=0-0"}
+    #: Сколько байт начала тела сравнивается, когда размер ответа неизвестен.
+    _FINGERPRINT_BYTES: int = 1024
+
     def __init__(self, base_url: str, wordlist: List[str], concurrency: int = 10) -> None:
         """Инициализирует BruteForcer с базовым URL, списком слов и уровнем конкуренции."""
         self.base_url: str = base_url
         self.wordlist: List[str] = wordlist
-        self.semaphore = asyncio.Semaphore(concurrency)
+        self.concurrency: int = concurrency
+        # URL-ы собираются один раз здесь, а не в цикле раздачи задач.
+        self._urls: List[str] = _build_urls(base_url, wordlist)
+        # Порядок опроса: по длине и затем лексикографически, чтобы соседние
+        # запросы делили префикс (локальность кэша CDN/прокси). Индекс сохраняет
+        # позицию в словаре, по нему run() восстанавливает исходный порядок.
+        self._probe_order: List[Tuple[int, str]] = sorted(
+            enumerate(self._urls), key=lambda item: (len(item[1]), item[1])
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Счётчик запросов в полёте под Condition: в отличие от Semaphore, предел
+        # можно безопасно менять на ходу (см. set_concurrency).
+        self._cond = asyncio.Condition()
+        self._inflight: int = 0
+        self._limit: int = concurrency
+
+    async def __aenter__(self) -> "BruteForcer":
+        """Открывает собственную сессию, общую для всех запусков внутри блока ``async with``."""
+        self._session = make_brute_session(self.concurrency)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> None:
+        """Закрывает собственную сессию."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _resolve_session(self, session: Optional[aiohttp.ClientSession]) -> aiohttp.ClientSession:
+        """Возвращает переданную сессию или собственную, открытую через ``async with``."""
+        if session is not None:
+            return session
+        if self._session is None:
+            raise RuntimeError("BruteForcer: передайте session или используйте 'async with'")
+        return self._session
+
+    async def set_concurrency(self, limit: int) -> None:
+        """Меняет предел одновременных запросов, в том числе во время перебора.
+
+        Предел не превышает ``concurrency`` — число воркеров пула; снижение
+        позволяет адаптивно притормозить перебор (например, при ответах 429).
+        """
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        async with self._cond:
+            self._limit = min(limit, self.concurrency)
+            self._cond.notify_all()
+
+    async def _acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._inflight < self._limit)
+            self._inflight += 1
+
+    async def _release(self) -> None:
+        async with self._cond:
+            self._inflight -= 1
+            self._cond.notify(1)
 
     async def fetch(self, session: aiohttp.ClientSession, url: str) -> Union[HiddenResource, None]:
-        """Отправляет запрос к URL и возвращает HiddenResource при статусе 2xx."""
-        async with self.semaphore:
-            try:
-                async with session.get(url) as response:
-                    if 200 <= response.status < 300:
-                        return HiddenResource(url, response.status)
-            except Exception as e:
-                logger.exception(f"Ошибка при запросе {url}: {e}")
+        """Проверяет URL и возвращает HiddenResource, если статус из ``_INTERESTING_STATUS``.
+
+        Для перебора нужен только статус, поэтому сначала отправляется HEAD;
+        если сервер его не поддерживает, выполняется GET c ``Range: bytes=0-0``,
+        чтобы не тянуть тело ответа. Редиректы не выполняются: сам 3xx уже
+        говорит о существовании пути, а его цель записывается в ``location``.
+        """
+        try:
+            # Нужны только статус и заголовки: тело ответа не читается.
+            async with session.head(url, allow_redirects=False) as response:
+                pass
+            if response.status in self._HEAD_FALLBACK_STATUS:
+                async with session.get(
+                    url, headers=self._RANGE_HEADERS, allow_redirects=False
+                ) as response:
+                    pass
+            if response.status in self._INTERESTING_STATUS:
+                return HiddenResource(
+                    url,
+                    response.status,
+                    response.headers.get("Content-Type", ""),
+                    _response_size(response),
+                    (
+                        response.headers.get("Location", "")
+                        if response.status in self._REDIRECT_STATUS
+                        else ""
+                    ),
+                )
+        except Exception as e:
+            logger.exception("Ошибка при запросе %s: %s", url, e)
         return None
 
-    async def run(self, session: aiohttp.ClientSession) -> List[HiddenResource]:
-        """Запускает перебор слов и собирает найденные скрытые ресурсы."""
-        tasks = []
-        for word in self.wordlist:
-            target_url = normalize_url(f"{self.base_url}/{word}")
-            tasks.append(asyncio.create_task(self.fetch(session, target_url)))
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r is not None]
+    async def _body_digest(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """SHA-256 первых ``_FINGERPRINT_BYTES`` тела ответа (Range-GET) или None при ошибке."""
+        headers = {"Range": f"bytes=0-{self._FINGERPRINT_BYTES - 1}"}
+        try:
+            async with session.get(url, headers=headers, allow_redirects=False) as response:
+                head = await response.content.read(self._FINGERPRINT_BYTES)
+        except Exception as e:
+            logger.warning("Не удалось снять отпечаток %s: %s", url, e)
+            return None
+        return hashlib.sha256(head).digest()
+
+    async def _soft404_baseline(self, session: aiohttp.ClientSession) -> Optional[_Soft404]:
+        """Опрашивает заведомо несуществующий путь, чтобы распознать «мягкие 404».
+
+        Если сервер отвечает на случайный путь «интересным» статусом, этот ответ
+        становится базовой линией (см. ``_is_soft404``). Если его размер неизвестен,
+        дополнительно запоминается хэш начала тела.
+        """
+        url = _build_urls(self.base_url, [uuid4().hex])[0]
+        resource = await self.fetch(session, url)
+        if resource is None:
+            return None
+        logger.info("Сайт отвечает %s на несуществующие пути (soft 404)", resource.status)
+        digest = None
+        if resource.size is None and resource.status not in self._REDIRECT_STATUS:
+            digest = await self._body_digest(session, url)
+        return resource, digest
+
+    async def _is_soft404(
+        self, session: aiohttp.ClientSession, resource: HiddenResource, baseline: _Soft404
+    ) -> bool:
+        """Совпадает ли находка с базовой линией «мягкого 404».
+
+        Статусы должны совпасть; редиректы сравниваются по Location, остальные
+        ответы — по размеру, если он известен у обоих, иначе по хэшу начала тела.
+        Если сравнить нечем, находка сохраняется: ложная находка лучше потерянной.
+        """
+        base, base_digest = baseline
+        if resource.status != base.status:
+            return False
+        if resource.status in self._REDIRECT_STATUS:
+            return resource.location == base.location
+        if resource.size is not None and base.size is not None:
+            return resource.size == base.size
+        if base_digest is None:
+            return False
+        return await self._body_digest(session, resource.url) == base_digest
+
+    async def _probe(
+        self, session: Optional[aiohttp.ClientSession]
+    ) -> AsyncIterator[Tuple[int, HiddenResource]]:
+        """Прогоняет словарь через пул воркеров и отдаёт (индекс, находка) по мере готовности.
+
+        Вместо задачи на каждое слово работает фиксированный пул из ``concurrency``
+        воркеров, разбирающих общую очередь: число одновременных запросов не
+        зависит от размера словаря, а медленный URL не задерживает выдачу
+        остальных результатов. Очередь ограничена (``concurrency * 4``): продюсер
+        подаёт URL по мере разбора, а не раскладывает весь словарь заранее.
+        Находки, совпадающие с базовой линией «мягкого 404», отбрасываются.
+        """
+        client = self._resolve_session(session)
+        soft404 = await self._soft404_baseline(client) if self._urls else None
+        n_workers = min(self.concurrency, len(self._urls))
+        queue: asyncio.Queue[Optional[Tuple[int, str]]] = asyncio.Queue(maxsize=n_workers * 4 or 1)
+        results: asyncio.Queue[Optional[Tuple[int, HiddenResource]]] = asyncio.Queue()
+
+        async def producer() -> None:
+            for item in self._probe_order:
+                await queue.put(item)
+            for _ in range(n_workers):
+                await queue.put(None)  # сигнал завершения для каждого воркера
+
+        async def worker() -> None:
+            while (item := await queue.get()) is not None:
+                await self._acquire()
+                try:
+                    resource = await self.fetch(client, item[1])
+                    if resource is not None and soft404 is not None:
+                        if await self._is_soft404(client, resource, soft404):
+                            resource = None
+                finally:
+                    await self._release()
+                if resource is not None:
+                    results.put_nowait((item[0], resource))
+
+        tasks = [asyncio.create_task(producer())]
+        tasks += [asyncio.create_task(worker()) for _ in range(n_workers)]
+        done = asyncio.gather(*tasks)
+        done.add_done_callback(lambda _: results.put_nowait(None))
+        try:
+            while (found := await results.get()) is not None:
+                yield found
+            await done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def stream(
+        self, session: Optional[aiohttp.ClientSession] = None
+    ) -> AsyncIterator[HiddenResource]:
+        """Отдаёт найденные скрытые ресурсы по мере их обнаружения (порядок не гарантирован)."""
+        async for _, resource in self._probe(session):
+            yield resource
+
+    async def run(self, session: Optional[aiohttp.ClientSession] = None) -> List[HiddenResource]:
+        """Запускает перебор слов и собирает найденные ресурсы в порядке словаря.
+
+        Без явной session используется собственная сессия экземпляра::
+
+            async with BruteForcer(base_url, words) as forcer:
+                found = await forcer.run()
+        """
+        found = [item async for item in self._probe(session)]
+        found.sort(key=itemgetter(0))
+        return [resource for _, resource in found]
+
+
+def make_brute_session(concurrency: int = 10) -> aiohttp.ClientSession:
+    """Создаёт ClientSession, настроенную под перебор одного хоста.
+
+    Keep-alive соединения и кэш DNS переиспользуются между словами, а лимиты
+    коннектора согласованы с числом воркеров BruteForcer. Keep-alive держится
+    дольше стандартных 15 секунд, чтобы паузы между запусками перебора на том же
+    хосте не приводили к новым TCP/TLS-рукопожатиям.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=concurrency * 2,
+        limit_per_host=concurrency,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(connector=connector)
 
 
 async def brute_force_hidden_dirs(
-    session: aiohttp.ClientSession, base_url: str, wordlist_path: Path
+    session: Optional[aiohttp.ClientSession], base_url: str, wordlist_path: Path
 ) -> List[HiddenResource]:
-    """Запускает перебор скрытых директорий по файлу словаря и возвращает найденные ресурсы."""
+    """Запускает перебор скрытых директорий по файлу словаря и возвращает найденные ресурсы.
+
+    Если session не передана, BruteForcer открывает собственную через :func:`make_brute_session`.
+    """
     wordlist = read_wordlist(wordlist_path)
     forcer = BruteForcer(base_url, wordlist)
-    return await forcer.run(session)
+    if session is not None:
+        return await forcer.run(session)
+    async with forcer:
+        return await forcer.run()
@@ -8,60 +8,108 @@
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import sys
 from dataclasses import asdict, is_dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
 
 import click
-from rich.console import Console
 
 from . import __version__
-from .config import ScannerConfig
-from .scanner import SiteScanner
 
-console = Console()
+try:  # опционально: C-сериализатор (extra "fast")
+    import orjson
+except ImportError:  # pragma: no cover - orjson не установлен
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+
+    from .config import ScannerConfig
+
+
+class _LazyConsole:
+    """rich.Console создаётся при первом выводе: ``--version`` и ``--help`` не импортируют rich."""
+
+    def __init__(self) -> None:
+        self._console: Optional[Console] = None
+
+    def print(self, *args: Any, **kwargs: Any) -> None:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        self._console.print(*args, **kwargs)
+
+
+console = _LazyConsole()
+
+# Типы параметров click создаются один раз и разделяются декораторами.
+_FILE_PATH = click.Path(dir_okay=False, path_type=Path)
+_EXISTING_FILE_PATH = click.Path(exists=True, dir_okay=False, path_type=Path)
 
 # ---------------------------------------------------------------------------
-# Отчётные рендеры (при отсутствии используем fallback)
+# Отчётные рендеры
 # ---------------------------------------------------------------------------
-try:
-    from .report.json_report import render_json as _render_json  # type: ignore
-except Exception:  # pragma: no cover
-    _render_json = None  # type: ignore
-
-try:
-    from .report.html_report import render_html as _render_html  # type: ignore
-except Exception:  # pragma: no cover
-    _render_html = None  # type: ignore
+# Тяжёлые зависимости (asyncio, pydantic, aiohttp, Jinja2) импортируются лениво,
+# внутри команд, чтобы `--help` и `--version` не платили за весь стек сканера.
 
 
 def render_json(data: Any, path: Path) -> None:
-    """Сохранить отчёт; вызвать внешний шаблон, если доступен."""
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    if _render_json is not None:
-        try:
-            _render_json(data, path)  # type: ignore[arg-type]
-        except Exception as exc:  # pragma: no cover
-            console.print(f"[yellow]⚠ JSON‑шаблон упал:[/yellow] {exc}")
+    """Сохранить отчёт одной записью; ScanReport пишется своим потоковым сериализатором."""
+    from .aggregator import ScanReport
+
+    if isinstance(data, ScanReport):
+        from .report.json_report import render_json as _render_json
+
+        _render_json(data, path)
+        return
+    _write_report(path, _iter_json(data))
 
 
 def render_html(data: Any, path: Path) -> None:
-    """Создать HTML‑отчёт через шаблон или fallback."""
-    if _render_html is not None:
-        try:
-            _render_html(data, path)  # type: ignore[arg-type]
-            return
-        except Exception as exc:  # pragma: no cover
-            console.print(f"[yellow]⚠ HTML‑шаблон упал, fallback:[/yellow] {exc}")
-    html = (
-        "<!doctype html><meta charset=utf-8><title>Site Scout Report</title><pre>"
-        + json.dumps(data, ensure_ascii=False, indent=2)
-        + "</pre>"
+    """Создать HTML‑отчёт: JSON‑данные внутри ``<pre>``, одной записью.
+
+    Jinja2‑рендер :mod:`site_scout.report.html_report` требует директорию
+    шаблонов, которой у CLI нет, поэтому файл пишется сразу в итоговом виде.
+    """
+    _write_report(
+        path,
+        chain(
+            (b"<!doctype html><meta charset=utf-8><title>Site Scout Report</title><pre>",),
+            _iter_json(data),
+            (b"</pre>",),
+        ),
     )
-    path.write_text(html, encoding="utf-8")
+
+
+_WRITE_BUFFER = 1 << 17  # 128 KiB
+
+
+def _write_report(path: Path, chunks: Iterable[bytes]) -> None:
+    """Записать части отчёта за одно открытие файла через крупный буфер, без склейки."""
+    with open(path, "wb", buffering=_WRITE_BUFFER) as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+
+
+def _iter_json(data: Any) -> Iterator[bytes]:
+    """Отдаёт JSON по частям: список страниц — поэлементно, без общего буфера.
+
+    Результат побайтно совпадает с ``_dump_json(data)``, но в памяти одновременно
+    находится только сериализованный текущий элемент.
+    """
+    if not isinstance(data, (list, tuple)) or not data:
+        yield _dump_json(data)
+        return
+    sep = b"[\n  "
+    for item in data:
+        yield sep
+        yield _dump_json(item).replace(b"\n", b"\n  ")
+        sep = b",\n  "
+    yield b"\n]"
 
 
 # ---------------------------------------------------------------------------
@@ -83,9 +131,35 @@ def _jsonable(obj: Any) -> Any:  # noqa: C901 complexity acceptable
             pass
     if is_dataclass(obj) and not isinstance(obj, type):
         return _jsonable(asdict(obj))
+    if hasattr(obj, "__dict__"):
+        return _jsonable(vars(obj))
+    return str(obj)
+
+
+def _fallback(obj: Any) -> Any:
+    """``default=`` для orjson: типы, которые он не сериализует сам."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()  # Pydantic 2
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
     return str(obj)
 
 
+def _dump_json(data: Any, *, pretty: bool = True) -> bytes:
+    """Сериализовать произвольные модели в UTF‑8 JSON.
+
+    С orjson — один проход в C (dataclass/datetime нативно, прочее через
+    :func:`_fallback`); без него — :func:`_jsonable` + stdlib ``json``.
+    """
+    if orjson is not None:
+        opts = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=_fallback, option=opts | (orjson.OPT_INDENT_2 * pretty))
+    text = json.dumps(_jsonable(data), ensure_ascii=False, indent=2 if pretty else None)
+    return text.encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Асинхронный запуск сканера
 # ---------------------------------------------------------------------------
@@ -100,6 +174,8 @@ async def start_scan(cfg: ScannerConfig) -> List[Any]:  # noqa: D401
     Это гарантирует, что функция строго соответствует аннотации `List[Any]`,
     устраняя предупреждение Pyright `Generator -> List`.
     """
+    from .scanner import SiteScanner
+
     scn = SiteScanner(cfg)  # type: ignore[arg-type]
     result: Any
     try:
@@ -116,18 +192,7 @@ async def start_scan(cfg: ScannerConfig) -> List[Any]:  # noqa: D401
             return list(result)  # type: ignore[arg-type]
         except Exception:  # pragma: no cover
             pass
-        result_list: List[Any]
-    if isinstance(result, list):
-        result_list = result
-    elif hasattr(result, "__iter__") and not isinstance(result, (str, bytes)):
-        try:
-            result_list = list(result)  # type: ignore[arg-type]
-        except Exception:  # pragma: no cover
-            result_list = [result]
-    else:
-        result_list = [result]
-
-    return cast(List[Any], result_list)
+    return [result]
 
 
 # ---------------------------------------------------------------------------
@@ -136,21 +201,46 @@ async def start_scan(cfg: ScannerConfig) -> List[Any]:  # noqa: D401
 
 
 def _load_yaml_json(path: Path) -> Dict[str, Any]:
-    import json as _json  # noqa: E402
+    """Прочитать конфиг как словарь; отсутствующий файл даёт пустой словарь."""
+    # Общий читатель из config: PyYAML импортируется только при разборе YAML.
+    from .config import read_config_data
+
+    try:
+        return read_config_data(path)
+    except FileNotFoundError:
+        return {}
+
+
+def _run(coro: Any) -> Any:
+    """``asyncio.run`` на uvloop (extra "fast", кроме Windows), если он установлен.
+
+    ``uvloop.run`` создаёт цикл только для этого вызова: глобальная политика
+    цикла событий не меняется и не протекает в тесты и встраивающий код.
+    """
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - uvloop не установлен
+        import asyncio
+
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
-    import yaml
 
-    text = path.read_text(encoding="utf-8")
-    return yaml.safe_load(text) if path.suffix.lower() in {".yml", ".yaml"} else _json.loads(text)
+async def _gather(*aws: Any) -> List[Any]:
+    import asyncio
+
+    return await asyncio.gather(*aws)
 
 
 def _get_config(ctx: click.Context) -> ScannerConfig:
+    from .config import load_config
+
     cfg_path: Optional[Path] = ctx.obj.get("cfg_path")
     if cfg_path is None:
         console.print("[red]Error:[/red] --config обязателен или укажите URL")
         sys.exit(1)
     try:
-        return ScannerConfig.load(cfg_path)  # type: ignore[attr-defined]
+        return load_config(cfg_path)
     except Exception as exc:  # pragma: no cover
         console.print(f"[red]Ошибка конфига:[/red] {exc}")
         sys.exit(1)
@@ -163,7 +253,7 @@ def _get_config(ctx: click.Context) -> ScannerConfig:
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(__version__, "--version", prog_name="SiteScout")
-@click.option("--config", "config_path", type=click.Path(dir_okay=False, path_type=Path))
+@click.option("--config", "config_path", type=_FILE_PATH)
 @click.pass_context
 def cli(ctx: click.Context, config_path: Optional[Path]) -> None:  # noqa: D401
     """Site Scout — сканер сайтов."""
@@ -185,9 +275,7 @@ def config() -> None:  # noqa: D401
 @click.pass_context
 def cfg_show(ctx: click.Context) -> None:  # noqa: D401
     cfg = _get_config(ctx)
-    data = cfg.model_dump(mode="json")
-    data["base_url"] = str(data["base_url"]).rstrip("/")
-    console.print_json(json.dumps(data, ensure_ascii=False))
+    click.echo(cfg.model_dump_json(indent=2))
 
 
 @config.command("validate")
@@ -204,8 +292,8 @@ def cfg_validate(ctx: click.Context) -> None:  # noqa: D401
 
 @cli.command()
 @click.argument("url", required=False)
-@click.option("--json", "json_file", type=click.Path(dir_okay=False, path_type=Path))
-@click.option("--html", "html_file", type=click.Path(dir_okay=False, path_type=Path))
+@click.option("--json", "json_file", type=_FILE_PATH)
+@click.option("--html", "html_file", type=_FILE_PATH)
 @click.option("--scan-timeout", type=float)
 @click.pass_context
 def scan(  # noqa: D401
@@ -216,44 +304,63 @@ def scan(  # noqa: D401
     scan_timeout: Optional[float],
 ) -> None:
     """Сканировать URL и вывести/сохранить отчёты."""
+    import asyncio
+
+    from .config import ScannerConfig
 
     # ---- формируем конфиг --------------------------------------
     if url:
-        base: Dict[str, Any] = {}
         cfg_path: Optional[Path] = ctx.obj.get("cfg_path")
-        if cfg_path and cfg_path.exists():
-            base = _load_yaml_json(cfg_path)
+        base: Dict[str, Any] = _load_yaml_json(cfg_path) if cfg_path else {}
         base["base_url"] = url
         cfg = ScannerConfig.model_validate(base)
     else:
         cfg = _get_config(ctx)
 
-    # ---- выполняем сканер -------------------------------------
-    async def _runner() -> List[Any]:
-        return await start_scan(cfg)
+    from .logger import logger
+
+    logger.setLevel(cfg.log_level)
 
+    # ---- выполняем сканер -------------------------------------
+    # start_scan — всегда корутина: запускаем её напрямую, без обёрток.
+    coro = start_scan(cfg)
+    if scan_timeout:
+        coro = asyncio.wait_for(coro, scan_timeout)
     try:
-        pages_raw: List[Any] = (
-            asyncio.run(asyncio.wait_for(_runner(), scan_timeout))
-            if scan_timeout
-            else asyncio.run(_runner())
-        )
+        pages_raw: List[Any] = _run(coro)
     except asyncio.TimeoutError:
-        console.print("[red]Сканирование прервано по таймауту[/red]")
+        console.print("[red]Сканирование не завершено за отведённое время[/red]")
         sys.exit(1)
 
-    pages = _jsonable(pages_raw)
-
     # ---- вывод / сохранение -----------------------------------
     if not json_file and not html_file:
-        console.print_json(json.dumps(pages, ensure_ascii=False))
+        # Байты JSON пишутся прямо в бинарный stdout, минуя текстовую обёртку;
+        # у подменённого stdout (StringIO, перехват в тестах) буфера нет — тогда текстом.
+        sys.stdout.flush()
+        out = getattr(sys.stdout, "buffer", None)
+        if out is not None:
+            for chunk in _iter_json(pages_raw):
+                out.write(chunk)
+            out.write(b"\n")
+            out.flush()
+        else:
+            for chunk in _iter_json(pages_raw):
+                sys.stdout.write(chunk.decode("utf-8"))
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+    # JSON и HTML пишутся независимо — параллельно в потоках, чтобы дисковый I/O перекрывался.
+    writers = []
+    if json_file:
+        writers.append(asyncio.to_thread(render_json, pages_raw, json_file))
+    if html_file:
+        writers.append(asyncio.to_thread(render_html, pages_raw, html_file))
+    if writers:
+        _run(_gather(*writers))
 
     if json_file:
-        render_json(pages, json_file)
         console.print(f"[green]✓ JSON сохранён:[/green] {json_file}")
-
     if html_file:
-        render_html(pages, html_file)
         console.print(f"[green]✓ HTML сохранён:[/green] {html_file}")
 
 
@@ -263,12 +370,12 @@ def scan(  # noqa: D401
 
 
 @cli.command("report")
-@click.argument("report_json", type=click.Path(exists=True, dir_okay=False, path_type=Path))
-@click.option("--html", "html_file", type=click.Path(dir_okay=False, path_type=Path))
+@click.argument("report_json", type=_EXISTING_FILE_PATH)
+@click.option("--html", "html_file", type=_FILE_PATH)
 def report_cmd(report_json: Path, html_file: Optional[Path]) -> None:  # noqa: D401
     """Сгенерировать или пересоздать HTML отчёт из существующего JSON."""
     try:
-        data = json.loads(report_json.read_text(encoding="utf-8"))
+        data = json.loads(report_json.read_bytes())
     except Exception as exc:  # pragma: no cover
         console.print(f"[red]Не могу прочитать файл отчёта:[/red] {exc}")
         sys.exit(1)
@@ -4,21 +4,50 @@
 Public API:
 
 * ScannerConfig – pydantic-модель с описанием всех опций;
-* load_config – читает YAML или JSON и возвращает проверенный ScannerConfig.
+* load_config – читает YAML или JSON и возвращает проверенный ScannerConfig;
+* read_config_data – читает YAML или JSON как словарь без валидации.
 
 Тесты tests/test_config.py ожидают:
 * Отсутствие обязательного поля base_url или некорректный URL вызывает ValidationError;
 * Не существующие пути в параметре wordlists вызывают FileNotFoundError;
 * Вызов load_config(None) без наличия configs/default.yaml вызывает FileNotFoundError.
+
+Кэши: load_config помнит проверенные конфиги по (путь, размер, mtime), а уже
+найденные файлы словарей повторно не проверяются. Если словарь удалён после
+проверки, ошибку даст чтение словаря; чтобы проверка FileNotFoundError снова
+сработала в том же процессе (тесты, перезагрузка конфига), вызовите clear_caches().
 """
 from __future__ import annotations
 
+import errno
+import hashlib
 import json
+import os
+import re
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Union
+from stat import S_ISREG
+from typing import Annotated, Any, Dict, Literal, Union
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
-import yaml
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, ValidationError, model_validator
+try:  # опционально: C-парсер JSON (extra "fast")
+    import orjson
+except ImportError:  # pragma: no cover - orjson не установлен
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError наследует json.JSONDecodeError, обработка ошибок общая.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 class LocaleConfig(BaseModel):
@@ -28,6 +57,39 @@ class LocaleConfig(BaseModel):
     accept_languages: list[str] = Field(default_factory=list)
 
 
+#: Абсолютные пути словарей, уже найденные на диске (см. _is_known_file).
+_KNOWN_FILES: set[str] = set()
+
+
+def _is_known_file(path: Union[str, Path]) -> bool:
+    """``os.path.isfile`` с запоминанием положительных ответов.
+
+    Повторные конфиги с теми же словарями не делают stat заново. Отрицательный
+    результат не кэшируется, поэтому появившийся позже файл будет найден; если
+    файл удалят после проверки, ошибку даст уже read_wordlist при чтении.
+    Сбрасывается через clear_caches().
+    """
+    key = os.path.abspath(path)
+    if key in _KNOWN_FILES:
+        return True
+    if os.path.isfile(key):
+        _KNOWN_FILES.add(key)
+        return True
+    return False
+
+
+def _fspath(value: Any) -> Any:
+    """Path-подобные значения превращаются в str одним C-вызовом ``os.fspath``."""
+    return os.fspath(value) if isinstance(value, os.PathLike) else value
+
+
+#: Путь словаря хранится строкой: Path создаётся только там, где файл открывают.
+_WordlistPath = Annotated[str, BeforeValidator(_fspath)]
+
+# scheme://host[:port][/path]: для сканера большего разбора URL не требуется.
+_BASE_URL_RE = re.compile(r"^https?://[^/\s?#]+(?:[/?#]\S*)?$", re.IGNORECASE)
+
+
 class ScannerConfig(BaseModel):
     """Конфигурация для одного запуска сканирования."""
 
@@ -35,7 +97,7 @@ class ScannerConfig(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
     # Обязательные параметры
-    base_url: HttpUrl = Field(..., description="Корневой URL для сканирования.")
+    base_url: str = Field(..., description="Корневой URL для сканирования.")
 
     # Настройки процесса сканирования
     max_depth: int = Field(3, ge=0, description="Максимальная глубина обхода ссылок.")
@@ -44,70 +106,268 @@ class ScannerConfig(BaseModel):
     user_agent: str = Field("SiteScoutBot/1.0", min_length=1, description="Заголовок User-Agent.")
     rate_limit: float = Field(1.0, gt=0, description="Лимит запросов в секунду.")
     retry_times: int = Field(3, ge=0, description="Число повторных попыток при 5xx.")
+    max_download_bytes: int = Field(
+        10_000_000, ge=0, description="Максимальный размер бинарного ответа (байт)."
+    )
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        "INFO", description="Уровень логирования SiteScout."
+    )
 
     # Пути к файлам словарей для обхода
-    wordlists: Dict[str, Path] = Field(..., description="Пути к файлам словарей.")
+    wordlists: Dict[str, _WordlistPath] = Field(..., description="Пути к файлам словарей.")
 
     # Добавляем поле локализации
     localization: Dict[str, LocaleConfig] = Field(
         default_factory=dict, description="Настройки национальных сегментов."
     )
 
+    @field_validator("base_url")
+    @classmethod
+    def _check_base_url(cls, value: str) -> str:
+        """Проверяет, что base_url — http(s) URL, и убирает завершающий слеш.
+
+        Результат интернируется: base_url служит префиксом и ключом словарей
+        у нижележащих компонентов, сравнение по ссылке там дешевле.
+        """
+        if not _BASE_URL_RE.match(value):
+            raise ValueError("base_url должен быть абсолютным http(s) URL")
+        return sys.intern(value.rstrip("/"))
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> ScannerConfig:
+        """Создаёт конфиг без валидации (``model_construct``).
+
+        Только для данных, уже прошедших проверку, например ``model_dump()``
+        другого экземпляра: типы не приводятся, словари не проверяются.
+        Контейнеры из *data* не копируются — экземпляр разделяет их с вызывающим.
+        """
+        return cls.model_construct(**data)
+
     @model_validator(mode="after")
     def _check_wordlists_exist(self) -> ScannerConfig:
-        """Проверка существования файлов словарей."""
-        missing = [str(p) for p in self.wordlists.values() if not Path(p).is_file()]
-        if missing:
-            raise FileNotFoundError("Отсутствуют файлы словарей: " + ", ".join(missing))
+        """Проверка существования файлов словарей (один stat на файл, без лишних Path)."""
+        missing = (p for p in self.wordlists.values() if not _is_known_file(p))
+        first = next(missing, None)
+        if first is not None:
+            # Список собирается только при ошибке; filename — первый отсутствующий файл.
+            message = "Отсутствуют файлы словарей: " + ", ".join((first, *missing))
+            raise FileNotFoundError(errno.ENOENT, message, first)
         return self
 
 
 _DEFAULT_CFG = Path("configs/default.yaml")
 
+#: Размер кэша load_config; столько же путей помнит _LOADED_BY_DIGEST.
+_CONFIG_CACHE_SIZE = 8
+
+#: Последний проверенный конфиг для каждого пути и SHA-256 его содержимого.
+_LOADED_BY_DIGEST: Dict[str, tuple[bytes, ScannerConfig]] = {}
+
+
+def _parse_yaml(raw: bytes, path: Path) -> Any:
+    """Разбирает YAML; тип верхнего уровня проверяет load_config.
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    """Загружает и проверяет YAML-файл, возвращает словарь."""
+    PyYAML импортируется здесь, а не в модуле: код, создающий ScannerConfig
+    напрямую или читающий JSON, не платит за его загрузку.
+    """
+    import yaml
+
+    SafeLoader: type[yaml.CSafeLoader] | type[yaml.SafeLoader]
+    try:  # C-загрузчик libyaml в разы быстрее чисто питоновского SafeLoader.
+        SafeLoader = yaml.CSafeLoader
+    except AttributeError:  # pragma: no cover - PyYAML собран без libyaml
+        SafeLoader = yaml.SafeLoader
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        # Байты без промежуточного декодирования: libyaml разбирает UTF-8 сам.
+        data = yaml.load(raw, Loader=SafeLoader) or {}
     except yaml.YAMLError as exc:
         raise ValueError(f"Неправильный YAML в {path}: {exc}") from exc
-    if not isinstance(data, dict):
-        raise TypeError(f"Верхний уровень YAML должен быть mapping, получено {type(data).__name__}")
     return data
 
 
-def _read_json(path: Path) -> Dict[str, Any]:
-    """Загружает и проверяет JSON-файл, возвращает словарь."""
+def _parse_json(raw: bytes, path: Path) -> Any:
+    """Разбирает JSON; тип верхнего уровня проверяет load_config."""
     try:
-        data = json.loads(path.read_text(encoding="utf-8")) or {}
+        data = _json_loads(raw) or {}
     except json.JSONDecodeError as exc:
         raise ValueError(f"Неправильный JSON в {path}: {exc}") from exc
-    if not isinstance(data, dict):
-        raise TypeError(f"Верхний уровень JSON должен быть mapping, получено {type(data).__name__}")
+    return data
+
+
+def _yaml_cache_path(path: Path) -> Path:
+    """Путь JSON-кэша рядом с YAML-конфигом: ``config.yaml`` → ``config.yaml.cache.json``."""
+    return path.with_name(path.name + ".cache.json")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Записывает файл через временный файл и ``os.replace``: читатель не увидит половину."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            fp.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read_yaml_cached(path: Path, raw: bytes, size: int, mtime_ns: int) -> Any:
+    """Читает YAML через JSON-кэш, записанный для этой же версии файла.
+
+    Кэш хранит ``(size, st_mtime_ns)`` исходного YAML и используется только при
+    точном совпадении: восстановление старой версии файла (``cp -p``, ``tar``,
+    ``rsync -t``) не подменит конфиг устаревшим кэшем. В кэше лежит разобранный,
+    но не провалидированный mapping, поэтому валидация ScannerConfig выполняется
+    как обычно. Если кэш недоступен для записи или данные не переживают JSON
+    round-trip, кэш просто не создаётся.
+    """
+    cache = _yaml_cache_path(path)
+    source = [size, mtime_ns]
+    try:
+        cached = _parse_json(cache.read_bytes(), cache)
+        if isinstance(cached, dict) and cached.get("source") == source:
+            return cached["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = _parse_yaml(raw, path)
+    try:
+        text = json.dumps({"source": source, "data": data}, ensure_ascii=False)
+        if json.loads(text)["data"] == data:
+            _write_atomic(cache, text)
+    except (OSError, TypeError, ValueError):
+        pass
     return data
 
 
 def load_config(path: Union[str, Path, None]) -> ScannerConfig:
-    """Читает YAML или JSON и возвращает проверенный объект ScannerConfig."""
+    """Читает YAML или JSON и возвращает проверенный объект ScannerConfig.
+
+    Результат кэшируется по (путь, размер, mtime): повторная загрузка неизменённого
+    файла не повторяет ни разбор, ни валидацию. frozen запрещает лишь присваивание
+    полей, а словари wordlists/localization изменяемы, поэтому каждый вызов
+    возвращает глубокую копию кэшированного экземпляра: правки одного
+    вызывающего не видны остальным.
+    """
     if path is None:
-        if not _DEFAULT_CFG.exists():
-            raise FileNotFoundError("configs/default.yaml не найден и путь не задан")
-        path_obj = _DEFAULT_CFG
+        path_str = os.path.realpath(_DEFAULT_CFG)
+        missing: Union[str, Path] = "configs/default.yaml не найден и путь не задан"
     else:
-        path_obj = Path(path).expanduser().resolve()
-        if not path_obj.is_file():
-            raise FileNotFoundError(path_obj)
+        path_str = os.path.realpath(os.path.expanduser(path))
+        missing = Path(path_str)
+    path_obj = Path(path_str)
+    while True:
+        # Один stat и на проверку «это файл», и на ключ кэша (mtime).
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            st = None
+        if st is None or not S_ISREG(st.st_mode):
+            raise FileNotFoundError(missing)
+        try:
+            cached = _load_config_cached(path_obj, st.st_size, st.st_mtime_ns)
+        except _StaleStamp:
+            # Файл переписан между stat и чтением: повторяем со свежим ключом.
+            continue
+        return cached.model_copy(deep=True)
+
+
+def read_config_data(path: Union[str, Path]) -> Dict[str, Any]:
+    """Читает YAML или JSON-конфиг как словарь, без валидации и без кэша load_config.
+
+    Для кода, который дополняет конфиг перед валидацией (например, base_url из
+    командной строки): каждый вызов возвращает новый словарь.
+
+    Raises:
+        FileNotFoundError: файла нет.
+        ValueError: формат не поддерживается или файл не разбирается.
+        TypeError: верхний уровень конфига — не mapping.
+    """
+    path_obj = Path(os.path.realpath(os.path.expanduser(path)))
+    raw, size, mtime_ns = _read_stamped(path_obj)
+    return _parse_config(path_obj, raw, size, mtime_ns)
 
+
+class _StaleStamp(Exception):
+    """Файл изменился после stat: прочитанное не соответствует ключу кэша load_config."""
+
+
+def _read_stamped(path_obj: Path) -> tuple[bytes, int, int]:
+    """Читает файл и его (размер, mtime) через один дескриптор.
+
+    Отметка снимается fstat до и после чтения; если файл менялся во время
+    чтения, оно повторяется, так что байты всегда соответствуют отметке.
+    """
+    with open(path_obj, "rb") as fp:
+        st = os.fstat(fp.fileno())
+        while True:
+            raw = fp.read()
+            after = os.fstat(fp.fileno())
+            if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+                return raw, st.st_size, st.st_mtime_ns
+            st = after
+            fp.seek(0)
+
+
+def _parse_config(path_obj: Path, raw: bytes, size: int, mtime_ns: int) -> Dict[str, Any]:
+    """Разбирает содержимое конфига по расширению файла и проверяет тип верхнего уровня."""
     suffix = path_obj.suffix.lower()
     if suffix in (".yaml", ".yml"):
-        data = _read_yaml(path_obj)
+        data = _read_yaml_cached(path_obj, raw, size, mtime_ns)
     elif suffix == ".json":
-        data = _read_json(path_obj)
+        data = _parse_json(raw, path_obj)
     else:
         raise ValueError(f"Неподдерживаемый формат конфига: {suffix}")
+    # Единственная проверка типа для обоих форматов.
+    if not isinstance(data, dict):
+        raise TypeError(
+            f"Верхний уровень конфига должен быть mapping, получено {type(data).__name__}"
+        )
+    return data
+
+
+@lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_config_cached(path_obj: Path, size: int, mtime_ns: int) -> ScannerConfig:
+    """Разбирает и валидирует конфиг; size и mtime_ns — ключ кэша и версия для JSON-кэша YAML.
+
+    Возвращаемый экземпляр принадлежит кэшу и наружу отдаётся только копией
+    (см. load_config). Если mtime изменился, а содержимое нет (touch, повторное
+    сохранение), возвращается уже проверенный экземпляр — совпадение SHA-256
+    дешевле разбора и валидации. Хэшируются те же байты, что потом разбираются:
+    файл читается один раз.
 
+    Raises:
+        _StaleStamp: отметка файла после чтения не совпала с (size, mtime_ns) —
+            файл переписан после stat в load_config.
+    """
+    key = str(path_obj)
+    raw, read_size, read_mtime_ns = _read_stamped(path_obj)
+    if (read_size, read_mtime_ns) != (size, mtime_ns):
+        # Исключения lru_cache не запоминает: чужие байты не попадут под этот ключ.
+        raise _StaleStamp(path_obj)
+    digest = hashlib.sha256(raw).digest()
+    previous = _LOADED_BY_DIGEST.get(key)
+    if previous is not None and previous[0] == digest:
+        return previous[1]
+
+    data = _parse_config(path_obj, raw, size, mtime_ns)
     try:
-        return ScannerConfig(**data)
+        # Скомпилированный SchemaValidator модели переиспользуется; model_validate
+        # отдаёт ему dict как есть, без распаковки в kwargs.
+        cfg = ScannerConfig.model_validate(data)
     except ValidationError:
         # Пробрасываем ошибку дальше, чтобы пользователь увидел детали
         raise
+    # Не больше путей, чем помнит lru_cache: самый давний вытесняется.
+    _LOADED_BY_DIGEST.pop(key, None)
+    _LOADED_BY_DIGEST[key] = (digest, cfg)
+    if len(_LOADED_BY_DIGEST) > _CONFIG_CACHE_SIZE:
+        del _LOADED_BY_DIGEST[next(iter(_LOADED_BY_DIGEST))]
+    return cfg
+
+
+def clear_caches() -> None:
+    """Сбрасывает кэши load_config и проверки существования словарей."""
+    _KNOWN_FILES.clear()
+    _LOADED_BY_DIGEST.clear()
+    _load_config_cached.cache_clear()
@@ -9,7 +9,7 @@ from collections import deque
 from typing import Any, Deque, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from site_scout.config import ScannerConfig
 from site_scout.crawler.fetcher import Fetcher
@@ -24,6 +24,8 @@ class AsyncCrawler:
     """Асинхронный краулер драйвер с поддержкой robots.txt, лимита запросов и retry/backoff."""
 
     _RETRY_STATUS: Tuple[int, ...] = tuple(range(500, 600)) + (429,)
+    #: предел одновременных соединений с сайтом: весь уровень BFS уходит в gather разом
+    _MAX_CONNECTIONS_PER_HOST: int = 16
 
     def __init__(self, config: ScannerConfig) -> None:
         """Инициализирует AsyncCrawler с конфигурацией сканирования."""
@@ -33,15 +35,23 @@ class AsyncCrawler:
         self.robots: Optional[RobotsTxtRules] = None
         self._req_times: Deque[float] = deque()
         self.fetcher: Optional[Fetcher] = None
+        # Запрос стартует только при свободном соединении: иначе ожидание в пуле
+        # коннектора съедало бы ClientTimeout(total) и страницы терялись бы по таймауту.
+        self._slots = asyncio.Semaphore(self._MAX_CONNECTIONS_PER_HOST)
 
     async def __aenter__(self) -> AsyncCrawler:
         """Открывает HTTP-сессию и загружает правила robots.txt."""
+        connector = TCPConnector(
+            limit_per_host=self._MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=300,
+        )
         self.session = ClientSession(
+            connector=connector,
             timeout=ClientTimeout(total=self.config.timeout),
             headers={"User-Agent": self.config.user_agent},
             raise_for_status=False,
         )
-        self.fetcher = Fetcher(self.session, self.config, self._RETRY_STATUS)
+        self.fetcher = Fetcher(self.session, self.config, self._RETRY_STATUS, self._slots)
 
         robots_url = str(self.config.base_url).rstrip("/") + "/robots.txt"
         try:
@@ -75,45 +85,59 @@ class AsyncCrawler:
             for depth in range(self.config.max_depth + 1):
                 if not level or len(results) >= self.config.max_pages:
                     break
-                pages = await self._crawl_level(level)
-                results.extend(pages)
+                fetched = await self._crawl_level(level, parse=depth < self.config.max_depth)
+                results.extend(page for page, _ in fetched)
                 if len(results) >= self.config.max_pages:
                     break
-                level = self._get_next_level(pages, visited, depth)
+                level = self._get_next_level(fetched, visited)
         return results
 
-    async def _crawl_level(self, level: List[Tuple[str, str]]) -> List[PageData]:
-        """Запускает fetch для списка (URL, norm) и возвращает PageData."""
-        tasks = [self._fetch_wrap(url, norm) for url, norm in level]
-        return [page for page in await asyncio.gather(*tasks) if page]
+    async def _crawl_level(
+        self, level: List[Tuple[str, str]], parse: bool
+    ) -> List[Tuple[PageData, List[str]]]:
+        """Запускает fetch для списка (URL, norm) и возвращает пары (PageData, ссылки)."""
+        tasks = [self._fetch_wrap(url, norm, parse) for url, norm in level]
+        return [item for item in await asyncio.gather(*tasks) if item]
 
     def _get_next_level(
         self,
-        pages: List[PageData],
+        fetched: List[Tuple[PageData, List[str]]],
         visited: Set[str],
-        depth: int,
     ) -> List[Tuple[str, str]]:
-        """Фильтрует страницы и формирует следующий уровень для BFS."""
+        """Фильтрует извлечённые ссылки и формирует следующий уровень для BFS."""
         next_level: List[Tuple[str, str]] = []
-        for page in pages:
-            if not isinstance(page.content, str) or depth >= self.config.max_depth:
-                continue
-            for link in extract_links(page):
-                path = urlparse(link).path
-                if self.robots and not self.robots.can_fetch(self.config.user_agent, path):
-                    continue
+        max_pages = self.config.max_pages
+        robots, user_agent = self.robots, self.config.user_agent
+        for _, links in fetched:
+            # Повторы на странице отсекаются одним проходом, до разбора URL и robots.
+            for link in dict.fromkeys(links):
                 norm = normalize_url(link)
-                if norm in visited or len(next_level) + len(visited) >= self.config.max_pages:
+                if norm in visited:
+                    continue
+                # Лимит только растёт: после его достижения ни одна ссылка уже не пройдёт.
+                if len(next_level) + len(visited) >= max_pages:
+                    return next_level
+                if robots and not robots.can_fetch(user_agent, urlparse(link).path):
                     continue
                 visited.add(norm)
                 next_level.append((link, norm))
         return next_level
 
-    async def _fetch_wrap(self, url: str, norm: str) -> Optional[PageData]:
-        """Обёртка для метода fetcher.fetch: сохраняет нормализованный URL."""
+    async def _fetch_wrap(
+        self, url: str, norm: str, parse: bool = False
+    ) -> Optional[Tuple[PageData, List[str]]]:
+        """Обёртка для метода fetcher.fetch: сохраняет нормализованный URL и извлекает ссылки.
+
+        Разбор HTML — чистая нагрузка на CPU, поэтому он выполняется в пуле потоков:
+        цикл событий тем временем продолжает загружать остальные страницы уровня.
+        """
         if not self.fetcher:
             raise RuntimeError("Fetcher not initialized")
         page = await self.fetcher.fetch(url, self.robots)
-        if page:
-            page.url = norm
-        return page
+        if not page:
+            return None
+        page.url = norm
+        links: List[str] = []
+        if parse and isinstance(page.content, str):
+            links = await asyncio.to_thread(extract_links, page)
+        return page, links
@@ -5,28 +5,38 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from typing import Deque, Optional, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any, Deque, List, Optional, Sequence
 
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession
 
 from site_scout.config import ScannerConfig
 from site_scout.crawler.models import PageData
 from site_scout.crawler.robots import RobotsTxtRules
+from site_scout.logger import logger
 
 
 class Fetcher:
     """Обрабатывает HTTP-fetcher с rate limit, retry/backoff и таймаутом."""
 
+    _CHUNK_SIZE: int = 64 * 1024
+
     def __init__(
         self,
         session: ClientSession,
         config: ScannerConfig,
         retry_status: Sequence[int],
+        slots: Optional[asyncio.Semaphore] = None,
     ) -> None:
-        """Инициализирует Fetcher с сессией aiohttp, конфигом и списком HTTP-статусов для retry."""
+        """Инициализирует Fetcher с сессией aiohttp, конфигом и списком HTTP-статусов для retry.
+
+        ``slots`` ограничивает число одновременных запросов; семафор держится только
+        на время HTTP-запроса, паузы backoff между попытками слот не занимают.
+        """
         self.session = session
         self.config = config
         self._retry_status = retry_status
+        self._slots: AbstractAsyncContextManager[Any] = slots or nullcontext()
         self._req_times: Deque[float] = deque()
 
     async def fetch(
@@ -47,7 +57,7 @@ class Fetcher:
         attempts = 0
         while True:
             try:
-                async with self.session.get(url, raise_for_status=False) as resp:
+                async with self._slots, self.session.get(url, raise_for_status=False) as resp:
                     if resp.status == 404:
                         return None
                     if resp.status in self._retry_status:
@@ -56,8 +66,7 @@ class Fetcher:
                     if "html" in ctype or "json" in ctype:
                         text = await resp.text()
                         return PageData(url, text)
-                    data = await resp.read()
-                    return PageData(url, data)
+                    return PageData(url, await self._read_body(url, resp))
             except asyncio.TimeoutError:
                 return None
             except ClientError:
@@ -67,3 +76,26 @@ class Fetcher:
                 await asyncio.sleep(min(2**attempts, 60))
 
         return None
+
+    async def _read_body(self, url: str, resp: ClientResponse) -> bytes:
+        """Читает бинарное тело ответа частями, не превышая лимит по размеру.
+
+        Тело больше ``config.max_download_bytes`` отбрасывается целиком (возвращается
+        ``b""``): страница остаётся в результатах, но огромный файл не держится в
+        памяти. Если размер известен из Content-Length, тело даже не читается.
+        """
+        limit = self.config.max_download_bytes
+        if resp.content_length is not None and resp.content_length > limit:
+            logger.info(
+                "Skipping body of %s: Content-Length %d > %d", url, resp.content_length, limit
+            )
+            return b""
+        chunks: List[bytes] = []
+        total = 0
+        async for chunk in resp.content.iter_chunked(self._CHUNK_SIZE):
+            total += len(chunk)
+            if total > limit:
+                logger.info("Skipping body of %s: larger than %d bytes", url, limit)
+                return b""
+            chunks.append(chunk)
+        return b"".join(chunks)
@@ -3,29 +3,50 @@
 
 from __future__ import annotations
 
-from typing import List
+import re
+from html import unescape
+from typing import Iterator, List
 from urllib.parse import urljoin, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-
 from site_scout.crawler.models import PageData
 
+# Комментарии и содержимое <script>/<style> не размечают ссылок: вырезаются до поиска.
+# Незакрытый блок, как и в браузере, тянется до конца документа: альтернатива \Z
+# делает проход линейным (иначе каждый незакрытый тег — отдельный скан до конца).
+_SKIP_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)|<(script|style)\b.*?(?:</\1\s*>|\Z)", re.IGNORECASE | re.DOTALL
+)
+# Открывающий тег <a> целиком: значения в кавычках могут содержать ">".
+_A_TAG_RE = re.compile(r"""<a\s((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.IGNORECASE)
+# Один атрибут тега: имя и значение в двойных, одинарных кавычках или без них
+# (группы 2, 3, 4). Атрибуты разбираются подряд, поэтому ``data-href`` или текст
+# внутри значения другого атрибута не принимаются за href.
+_ATTR_RE = re.compile(r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+
+
+def _iter_hrefs(content: str) -> Iterator[str]:
+    """Перебирает значения href тегов <a> одним проходом по сырому HTML, без DOM."""
+    for tag in _A_TAG_RE.finditer(_SKIP_RE.sub("", content)):
+        for attr in _ATTR_RE.finditer(tag.group(1)):
+            if attr.group(1).lower() == "href":
+                if attr.lastindex and attr.lastindex > 1:
+                    yield attr.group(attr.lastindex)
+                break  # как в HTML: учитывается первый href тега
+
 
 def extract_links(page: PageData) -> List[str]:
     """Извлекает внутренние HTTP(S)-ссылки из содержимого страницы."""
-    soup = BeautifulSoup(page.content, "html.parser")
+    content = page.content
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", "replace")
     base_netloc = urlparse(page.url).netloc
     links: List[str] = []
-    for tag in soup.find_all("a", href=True):
-        if not isinstance(tag, Tag):
-            continue
-        href_val = tag.get("href")
-        if not isinstance(href_val, str):
-            continue
-        raw = href_val.strip()
+    for href in _iter_hrefs(content):
+        raw = href.strip()
         if raw.startswith(("mailto:", "javascript:")):
             continue
+        if "&" in raw:
+            raw = unescape(raw)
         absolute = urljoin(page.url, raw)
         parsed = urlparse(absolute)
         if parsed.scheme in ("http", "https") and parsed.netloc == base_netloc:
@@ -51,6 +51,6 @@ class Engine:
             raise
 
     @staticmethod
-    def aggregate_results(raw_results: List[Any]) -> ScanReport:
+    def aggregate_results(raw_results: List[Any], *, keep_raw: bool = False) -> ScanReport:
         """Агрегирует сырые результаты в объект ScanReport через site_scout.aggregator."""
-        return aggregate_results(raw_results)
+        return aggregate_results(raw_results, keep_raw=keep_raw)
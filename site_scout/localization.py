@@ -8,15 +8,18 @@ from typing import Collection
 from site_scout.logger import logger
 from site_scout.utils import PageData, is_valid_url, normalize_url
 
+_QUERY_OR_FRAGMENT_RE = re.compile(r"[#?].*")
+_HREF_RE = re.compile(r"href=['\"](.*?)['\"]", re.IGNORECASE)
+
 
 def normalize_path(path: str) -> str:
     """Удаляет параметры и фрагменты из URL."""
-    return re.sub(r"[#?].*", "", path)
+    return _QUERY_OR_FRAGMENT_RE.sub("", path)
 
 
 def extract_links_from_content(content: str) -> list[str]:
     """Извлекает все ссылки из текста страницы."""
-    links = re.findall(r"href=['\"](.*?)['\"]", content, flags=re.IGNORECASE)
+    links = _HREF_RE.findall(content)
     return [link for link in links if link]
 
 
@@ -59,5 +62,5 @@ def extract_segments_from_urls(urls: list[str], base_domain: str) -> list[str]:
 def remove_duplicates(urls: Collection[str]) -> list[str]:
     """Удаляет дублирующиеся URL."""
     unique_urls = list(set(urls))
-    logger.debug(f"Удалено {len(urls) - len(unique_urls)} дубликатов")
+    logger.debug("Удалено %d дубликатов", len(urls) - len(unique_urls))
     return unique_urls
@@ -9,15 +9,21 @@ Highlights
       from site_scout.logger import logger
       logger.info("Scanning started")
 * Re-configurable at runtime via :func:`configure`.
+* Non-blocking: records are enqueued and written by a background listener thread.
+* Lazy: handlers, the listener thread and the log file are set up on the first
+  emitted record, so importing the package costs no I/O.  The defaults are
+  skipped if the caller has already added handlers or called :func:`configure`.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import sys
 from logging import Formatter
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Final, TextIO, Union
+from queue import SimpleQueue
+from typing import Final, Optional, TextIO, Tuple, Union
 
 # --------------------------------------------------------------------------- #
 # Constants & basic types                                                     #
@@ -29,6 +35,12 @@ _DEFAULT_FORMAT: Final[str] = "%(_ asctime)s | %(levelname)-8s | %(name)s | %(me
 _LOGGER_NAME: Final[str] = "SiteScout"
 _LevelT = Union[int, str]
 
+#: Background listeners started by :func:`configure` (stopped on reconfigure/exit).
+_listeners: list[QueueListener] = []
+
+#: Arguments of the last :func:`init_logging` call (makes repeated calls no-ops).
+_initialized: Optional[Tuple[_LevelT, Union[Path, str, None]]] = None
+
 # --------------------------------------------------------------------------- #
 # Helper builders                                                             #
 # --------------------------------------------------------------------------- #
@@ -58,12 +70,22 @@ def _file_handler(file: Path | str, fmt: str) -> RotatingFileHandler:
 # --------------------------------------------------------------------------- #
 
 
+def _stop_listeners() -> None:
+    """Stop background listeners, flushing every queued record to its handlers."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
 def configure(
     *,
     level: _LevelT = "INFO",
     log_file: Path | str | None = None,
     log_format: str = _DEFAULT_FORMAT,
     replace_handlers: bool = True,
+    queued: bool = True,
 ) -> logging.Logger:
     """(Re)configure the global project logger.
 
@@ -77,17 +99,37 @@ def configure(
         Format string for :class:`logging.Formatter`.
     replace_handlers
         *True* – remove existing handlers; *False* – just append new one(s).
+    queued
+        *True* – the logger only enqueues records (:class:`QueueHandler`), and a
+        background :class:`QueueListener` thread writes them to console/file, so
+        the asyncio event loop never blocks on output I/O.
     """
     lg = logging.getLogger(_LOGGER_NAME)
     lg.setLevel(level)
 
-    if replace_handlers:
-        lg.handlers.clear()
-
-    lg.addHandler(_stdout_handler(log_format))
-
+    handlers: list[logging.Handler] = [_stdout_handler(log_format)]
     if log_file is not None:
-        lg.addHandler(_file_handler(log_file, log_format))
+        handlers.append(_file_handler(log_file, log_format))
+
+    stale = _listeners[:] if replace_handlers else []
+    if queued:
+        records: SimpleQueue[logging.LogRecord] = SimpleQueue()
+        listener = QueueListener(records, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+        handlers = [QueueHandler(records)]
+
+    # The handler list is swapped in one assignment, so a concurrent dispatch sees
+    # either the old handlers or the new ones, never an empty logger.
+    if replace_handlers:
+        lg.handlers = handlers
+    else:
+        # Explicit configuration always wins over the lazy defaults.
+        kept = [h for h in lg.handlers if not isinstance(h, _DeferredSetupHandler)]
+        lg.handlers = kept + handlers
+    for old in stale:
+        _listeners.remove(old)
+        old.stop()
 
     lg.propagate = False
     return lg
@@ -96,14 +138,73 @@ def configure(
 def init_logging(
     level: _LevelT = "INFO", log_file: Path | str | None = "site_scout.log"
 ) -> logging.Logger:
-    """Backward-compatible alias used by legacy code."""
+    """Backward-compatible alias used by legacy code.
+
+    Idempotent: a repeated call with the same arguments returns the already
+    configured logger instead of rebuilding its handlers.
+    """
+    global _initialized
+    if _initialized == (level, log_file):
+        return logging.getLogger(_LOGGER_NAME)
+    _initialized = (level, log_file)
     return configure(level=level, log_file=log_file, replace_handlers=True)
 
 
+class _DeferredSetupHandler(logging.Handler):
+    """Placeholder that installs the default handlers when the first record arrives.
+
+    The defaults (:func:`init_logging`) are only installed if the placeholder is
+    the logger's sole handler; handlers added by the caller are left untouched.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._done = False
+        self._installed = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Handler.handle() holds self.lock, so only one thread performs the setup.
+        lg = logging.getLogger(_LOGGER_NAME)
+        if self._done:
+            # This thread reached the placeholder before the setup replaced it and
+            # waited on the lock; forward the record to the installed handlers.
+            if self._installed:
+                lg.handle(record)
+            return
+        self._done = True
+        if any(h is not self for h in lg.handlers):
+            # Other handlers exist: they receive this record from the current dispatch.
+            _drop_placeholder(lg)
+            return
+        # The placeholder stays attached until init_logging() swaps in the real
+        # handlers, so no record arrives at a logger without handlers.
+        init_logging(level=logging.getLevelName(lg.level))
+        self._installed = True
+        lg.handle(record)
+
+
+def _drop_placeholder(lg: logging.Logger) -> None:
+    """Remove :class:`_DeferredSetupHandler` from *lg*.
+
+    The handler list is rebound rather than mutated, so a dispatch that is
+    currently iterating over it still reaches every handler.
+    """
+    lg.handlers = [h for h in lg.handlers if not isinstance(h, _DeferredSetupHandler)]
+
+
+def _lazy_logger() -> logging.Logger:
+    """Return the project logger with real handlers deferred to its first record."""
+    lg = logging.getLogger(_LOGGER_NAME)
+    lg.setLevel("INFO")
+    lg.propagate = False
+    lg.addHandler(_DeferredSetupHandler())
+    return lg
+
+
 # --------------------------------------------------------------------------- #
 # Ready-to-use instance                                                       #
 # --------------------------------------------------------------------------- #
 
-logger: logging.Logger = init_logging()
+logger: logging.Logger = _lazy_logger()
 
 __all__ = ["logger", "configure", "init_logging"]
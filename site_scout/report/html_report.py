@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Union
 
@@ -11,6 +12,21 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 from site_scout.aggregator import ScanReport
 
 
+@lru_cache(maxsize=8)
+def _environment(template_dir: str) -> Environment:
+    """Возвращает общий Jinja2 Environment для директории шаблонов.
+
+    Скомпилированные шаблоны хранятся в кэше окружения и переиспользуются
+    между вызовами :func:`render_html`.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=400,
+    )
+
+
 def render_html(
     report: ScanReport,
     template_dir: Union[Path, str],
@@ -40,11 +56,7 @@ def render_html(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=select_autoescape(["html", "xml"]),
-    )
-    template = env.get_template("report.html.j2")
+    template = _environment(str(template_dir.resolve())).get_template("report.html.j2")
 
     context: dict[str, Any] = {
         "pages": report.pages,
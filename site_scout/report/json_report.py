@@ -4,7 +4,6 @@
 
 Сериализация объекта ScanReport в файл.
 """
-import json
 from pathlib import Path
 
 from site_scout.aggregator import ScanReport
@@ -28,16 +27,8 @@ def render_json(report: ScanReport, output_path: Path | str) -> Path:
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    # Сериализация: dataclasses -> dict
-    data = {
-        "pages": report.pages,
-        "documents": report.documents,
-        "hidden_resources": report.hidden_resources,
-        "locales": report.locales,
-    }
-
-    # Запись в файл с отступами и Unicode
+    # Потоковая запись в файл с отступами и Unicode, без промежуточной строки
     with output.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        report.write_json(f, pretty=True)
 
     return output
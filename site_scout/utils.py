@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Collection, List, Sequence, Union
+from typing import Collection, List, Sequence, Tuple, Union
 from urllib.parse import urlparse, urlunparse
 
 from site_scout.logger import logger
@@ -59,13 +62,27 @@ def extract_domain(url: str) -> str:
     return urlparse(url).netloc
 
 
+@lru_cache(maxsize=8)
+def _load_wordlist(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Разбирает wordlist; кэш по (путь, mtime) общий для всех запусков перебора."""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return tuple(sys.intern(word) for word in map(str.strip, lines) if word)
+
+
 def read_wordlist(path: Union[str, Path]) -> List[str]:
-    """Читает wordlist, возвращает непустые строки без пробелов."""
+    """Читает wordlist, возвращает непустые строки без пробелов.
+
+    Повторное чтение неизменённого файла берётся из кэша: строки разделяются
+    (и интернируются) между вызовами, копируется только сам список.
+    """
     p = Path(path)
-    if not p.exists():
+    # Один stat и на проверку существования, и на mtime для ключа кэша.
+    try:
+        mtime_ns = os.stat(p).st_mtime_ns
+    except FileNotFoundError:
         logger.error("Wordlist not found: %s", p)
-        raise FileNotFoundError(f"Wordlist file not found: {p}")
-    words = [line.strip() for line in p.read_text(encoding="utf-8").splitlines() if line.strip()]
+        raise FileNotFoundError(f"Wordlist file not found: {p}") from None
+    words = list(_load_wordlist(os.path.abspath(p), mtime_ns))
     logger.debug("Loaded %d entries from wordlist %s", len(words), p)
     return words
 
@@ -5,10 +5,20 @@ from typing import Dict
 
 import pytest
 
-from site_scout.config import ScannerConfig
+from site_scout.config import ScannerConfig, clear_caches
 from site_scout.crawler.models import PageData
 
 
+@pytest.fixture(autouse=True)
+def _fresh_config_caches():
+    """
+    Reset config caches so that files deleted by one test are not remembered by another.
+    """
+    clear_caches()
+    yield
+    clear_caches()
+
+
 @pytest.fixture()
 def wordlists_files(tmp_path) -> Dict[str, Path]:
     """
@@ -0,0 +1,103 @@
+# File: tests/test_aggregator.py
+"""Тесты агрегации сырых результатов в ScanReport и его сериализации."""
+import json
+
+import pytest
+
+from site_scout.aggregator import ScanReport, aggregate_results
+
+
+def test_json_skips_raw_results():
+    raw = [{"url": "http://example.com/", "documents": [{"name": "a.pdf", "size": 10}]}]
+    report = aggregate_results(raw)
+    data = json.loads(report.json())
+    assert set(data) == {"pages", "documents", "hidden_resources", "locales"}
+    assert data["pages"][0]["url"] == "http://example.com/"
+    assert data["documents"][0] == {"name": "a.pdf", "url": "", "size": 10, "mime": ""}
+
+
+def test_json_pretty_keeps_unicode():
+    report = ScanReport(locales={"ja": ["http://example.com/日本"]})
+    text = report.json(pretty=True)
+    assert "日本" in text
+    assert "\n  " in text
+
+
+def test_aggregate_mixed_dicts_and_objects():
+    class Hidden:
+        url = "http://example.com/.git/"
+        status = 200
+        content_type = "text/plain"
+
+    class Entry:
+        url = "http://example.com/a"
+        hidden_paths = [Hidden()]
+
+    report = aggregate_results([{"url": "http://example.com/"}, Entry()])
+    assert [p["url"] for p in report.pages] == ["http://example.com/", "http://example.com/a"]
+    assert report.hidden_resources == [
+        {"url": "http://example.com/.git/", "status": 200, "type": "text/plain", "size": 0}
+    ]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_write_html_matches_generate_html(tmp_path, monkeypatch, fast):
+    import site_scout.aggregator as aggregator
+
+    if not fast:
+        monkeypatch.setattr(aggregator, "orjson", None)
+    report = aggregate_results([{"url": "http://example.com/日本"}])
+    out = tmp_path / "report.html"
+    with out.open("w", encoding="utf-8") as fp:
+        report.write_html(fp)
+    text = out.read_text(encoding="utf-8")
+    assert text == report.generate_html()
+    assert text.startswith("<html><body><pre>") and text.endswith("</pre></body></html>")
+
+
+def test_locales_sorted_from_last_entry():
+    raw = [
+        {"url": "http://example.com/"},
+        {"locales": {"jp": {"https://jp.example.com/b", "https://jp.example.com/a"}, "kr": None}},
+    ]
+    report = aggregate_results(raw)
+    assert report.locales == {"jp": ["https://jp.example.com/a", "https://jp.example.com/b"]}
+
+
+def test_pages_read_parsed_fields_from_plain_and_slotted_objects():
+    from site_scout.parser.html_parser import ParsedPage
+
+    class Parsed:
+        def __init__(self):
+            self.links = ["http://example.com/a"]
+            self.meta = {"title": "A"}
+
+    class Full:
+        links = ["http://example.com/c"]  # атрибут класса
+        meta: dict = {}
+        headers: dict = {}
+
+        @property
+        def headings(self):
+            return {"h1": ["C"]}
+
+    slotted = ParsedPage(url="http://example.com/b", title="B", links=["x"], text="")
+    report = aggregate_results(
+        [
+            {"url": "http://example.com/", "parsed": Parsed()},
+            {"url": "b", "parsed": slotted},
+            {"url": "c", "parsed": Full()},
+        ]
+    )
+    assert report.pages[0]["links"] == ["http://example.com/a"]
+    assert report.pages[0]["meta"] == {"title": "A"}
+    assert report.pages[0]["headings"] == {}
+    assert report.pages[1]["links"] == ["x"]
+    assert report.pages[2]["links"] == ["http://example.com/c"]
+    assert report.pages[2]["headings"] == {"h1": ["C"]}
+
+
+def test_raw_results_kept_only_on_request():
+    raw = [{"url": "http://example.com/"}]
+    assert aggregate_results(raw).raw_results is None
+    assert aggregate_results(raw, keep_raw=True).raw_results is raw
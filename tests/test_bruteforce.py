@@ -0,0 +1,276 @@
+# File: tests/test_bruteforce.py
+# Test-suite for the dictionary brute-forcer of hidden paths
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from site_scout.bruteforce import BruteForcer, brute_force_hidden_dirs
+
+#: paths that exist on the test server
+FOUND = ("admin", "backup", "secret")
+
+
+@pytest.fixture()
+def stats() -> dict[str, int]:
+    """Counters shared between the test server and the test body."""
+    return {"in_flight": 0, "peak": 0, "requests": 0}
+
+
+@pytest_asyncio.fixture
+async def brute_server(unused_tcp_port: int, stats: dict[str, int]) -> AsyncIterator[str]:
+    app = web.Application()
+
+    async def handle(request: web.Request) -> web.Response:
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            stats["in_flight"] -= 1
+        name = request.match_info["name"]
+        if name in FOUND:
+            return web.Response(text="ok")
+        if name == "private":
+            return web.Response(status=403)
+        if name == "old":
+            raise web.HTTPMovedPermanently("/admin/")
+        return web.Response(status=404)
+
+    app.router.add_route("*", "/{name}", handle)
+    app.router.add_route("*", "/{name}/", handle)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", unused_tcp_port)
+    await site.start()
+    try:
+        yield f"http://localhost:{unused_tcp_port}"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_run_finds_existing_paths_in_wordlist_order(brute_server: str):
+    words = ["secret", "nope", "admin", "missing", "backup"]
+    forcer = BruteForcer(brute_server, words, concurrency=3)
+    async with aiohttp.ClientSession() as session:
+        found = await forcer.run(session)
+
+    assert [r.url.rstrip("/").rsplit("/", 1)[-1] for r in found] == ["secret", "admin", "backup"]
+    assert all(r.status == 200 for r in found)
+
+
+@pytest.mark.asyncio()
+async def test_run_respects_concurrency(brute_server: str, stats: dict[str, int]):
+    words = [f"word{i}" for i in range(40)]
+    forcer = BruteForcer(brute_server, words, concurrency=4)
+    async with aiohttp.ClientSession() as session:
+        assert await forcer.run(session) == []
+
+    assert stats["requests"] >= len(words)
+    assert stats["peak"] <= 4
+
+
+@pytest.mark.asyncio()
+async def test_fetch_falls_back_to_ranged_get(unused_tcp_port: int):
+    app = web.Application()
+    seen: list[tuple[str, str | None]] = []
+
+    async def handle_get(request: web.Request) -> web.Response:
+        seen.append((request.method, request.headers.get("Range")))
+        return web.Response(status=206, text="x", headers={"Content-Range": "bytes 0-0/1234"})
+
+    async def handle_head(request: web.Request) -> web.Response:
+        seen.append((request.method, None))
+        return web.Response(status=405)
+
+    app.router.add_route("HEAD", "/private/", handle_head)
+    app.router.add_route("GET", "/private/", handle_get)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", unused_tcp_port).start()
+    base = f"http://localhost:{unused_tcp_port}"
+    try:
+        async with aiohttp.ClientSession() as session:
+            found = await BruteForcer(base, []).fetch(session, f"{base}/private/")
+    finally:
+        await runner.cleanup()
+
+    assert found is not None and (found.status, found.size) == (206, 1234)
+    assert seen == [("HEAD", None), ("GET", "bytes=0-0")]
+
+
+@pytest.mark.asyncio()
+async def test_brute_force_hidden_dirs_without_session(brute_server: str, tmp_path):
+    wordlist = tmp_path / "paths.txt"
+    wordlist.write_text("admin\nnothing\n", encoding="utf-8")
+    found = await brute_force_hidden_dirs(None, brute_server, wordlist)
+    assert [r.status for r in found] == [200]
+
+
+@pytest.mark.parametrize("base", ["http://example.com", "https://example.com/app/"])
+def test_build_urls_matches_normalize_url(base: str):
+    from site_scout.bruteforce.brute_force import _build_urls
+    from site_scout.utils import normalize_url
+
+    words = [
+        "admin",
+        ".git",
+        ".env",
+        "backup.zip",
+        "a.",
+        "dir/",
+        "x/.",
+        "..",
+        "q?x=1",
+        "f#y",
+        "/lead",
+    ]
+    expected = [normalize_url(f"{base.rstrip('/')}/{w.lstrip('/')}") for w in words]
+    assert _build_urls(base, words) == expected
+    assert _build_urls(base, ["admin", "/admin", "admin/"]) == [expected[0]]
+
+
+@pytest.mark.asyncio()
+async def test_stream_yields_hits_as_they_complete(brute_server: str):
+    forcer = BruteForcer(brute_server, ["nope", "admin", "secret"], concurrency=2)
+    async with aiohttp.ClientSession() as session:
+        found = [r async for r in forcer.stream(session)]
+        # досрочный выход из генератора не оставляет висящих воркеров
+        async for _ in BruteForcer(brute_server, list(FOUND) * 5).stream(session):
+            break
+
+    assert sorted(r.url for r in found) == sorted(
+        [f"{brute_server}/admin/", f"{brute_server}/secret/"]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_context_manager_reuses_own_session(brute_server: str):
+    forcer = BruteForcer(brute_server, ["admin", "nope"])
+    with pytest.raises(RuntimeError):
+        await forcer.run()
+    async with forcer:
+        session = forcer._session
+        assert [r.status for r in await forcer.run()] == [200]
+        assert [r.status for r in await forcer.run()] == [200]
+        assert forcer._session is session
+    assert session is not None and session.closed
+
+
+@pytest.mark.asyncio()
+async def test_redirects_and_forbidden_are_reported(brute_server: str):
+    forcer = BruteForcer(brute_server, ["old", "private", "nope"])
+    async with forcer:
+        found = await forcer.run()
+    assert [(r.url.rsplit("/", 2)[-2], r.status) for r in found] == [("old", 301), ("private", 403)]
+    assert [r.location for r in found] == ["/admin/", ""]
+
+
+@pytest.mark.asyncio()
+async def test_run_with_empty_wordlist(brute_server: str, stats: dict[str, int]):
+    async with aiohttp.ClientSession() as session:
+        assert await BruteForcer(brute_server, []).run(session) == []
+    assert stats["requests"] == 0
+
+
+@pytest.mark.asyncio()
+async def test_set_concurrency_caps_requests_in_flight(brute_server: str, stats: dict[str, int]):
+    forcer = BruteForcer(brute_server, [f"word{i}" for i in range(8)], concurrency=4)
+    with pytest.raises(ValueError):
+        await forcer.set_concurrency(0)
+    await forcer.set_concurrency(1)
+    async with aiohttp.ClientSession() as session:
+        assert await forcer.run(session) == []
+    assert stats["peak"] == 1
+
+
+def test_probe_order_groups_by_length_and_prefix():
+    forcer = BruteForcer("http://example.com", ["backup", "a", "admin", "ab"])
+    assert [url for _, url in forcer._probe_order] == [
+        "http://example.com/a/",
+        "http://example.com/ab/",
+        "http://example.com/admin/",
+        "http://example.com/backup/",
+    ]
+    assert [idx for idx, _ in forcer._probe_order] == [1, 3, 2, 0]
+
+
+def test_read_wordlist_is_cached_until_file_changes(tmp_path):
+    import os
+
+    from site_scout.utils import read_wordlist
+
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text(" admin \n\nbackup\n", encoding="utf-8")
+    first = read_wordlist(wordlist)
+    second = read_wordlist(wordlist)
+    assert first == ["admin", "backup"]
+    assert first is not second and first[0] is second[0]
+
+    wordlist.write_text("secret\n", encoding="utf-8")
+    stat = wordlist.stat()
+    os.utime(wordlist, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_wordlist(wordlist) == ["secret"]
+
+
+@pytest.mark.asyncio()
+async def test_soft_404_responses_are_filtered(unused_tcp_port: int):
+    app = web.Application()
+
+    async def handle(request: web.Request) -> web.Response:
+        if request.match_info["name"] == "admin":
+            return web.Response(text="real admin page")
+        return web.Response(text="not found")  # «мягкий 404» со статусом 200
+
+    app.router.add_route("*", "/{name}/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", unused_tcp_port).start()
+    base = f"http://localhost:{unused_tcp_port}"
+    try:
+        async with aiohttp.ClientSession() as session:
+            found = await BruteForcer(base, ["nope", "admin", "missing"]).run(session)
+    finally:
+        await runner.cleanup()
+
+    assert [r.url for r in found] == [f"{base}/admin/"]
+
+
+@pytest.mark.asyncio()
+async def test_soft_404_without_content_length_keeps_real_hits(unused_tcp_port: int):
+    app = web.Application()
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        body = b"real admin page" if request.match_info["name"] == "admin" else b"not found"
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()  # ни Content-Length, ни Content-Range
+        await response.prepare(request)
+        if request.method != "HEAD":
+            await response.write(body)
+        await response.write_eof()
+        return response
+
+    app.router.add_route("*", "/{name}/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", unused_tcp_port).start()
+    base = f"http://localhost:{unused_tcp_port}"
+    try:
+        async with aiohttp.ClientSession() as session:
+            forcer = BruteForcer(base, ["nope", "admin", "missing"])
+            resource = await forcer.fetch(session, f"{base}/admin/")
+            found = await forcer.run(session)
+    finally:
+        await runner.cleanup()
+
+    assert resource is not None and resource.size is None
+    assert [r.url for r in found] == [f"{base}/admin/"]
@@ -3,7 +3,9 @@
 Проверяют команды `scan`, `config`, `--version`, а также обработку ошибок.
 """
 import asyncio
+import io
 import json
+import sys
 
 import pytest
 from click.testing import CliRunner
@@ -101,6 +103,21 @@ def test_scan_stdout(tmp_path, monkeypatch):
     assert output[0]["url"] == "http://example.com/"
 
 
+def test_scan_stdout_without_binary_buffer(tmp_path, monkeypatch):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text(
+        json.dumps({"base_url": "https://example.com", "wordlists": {}}), encoding="utf-8"
+    )
+    monkeypatch.chdir(tmp_path)
+    # Подменённый stdout без .buffer (как StringIO в IDE или при перехвате вывода).
+    fake_stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", fake_stdout)
+
+    cli.main(["--config", str(cfg_file), "scan"], standalone_mode=False)
+    output = json.loads(fake_stdout.getvalue())
+    assert output[0]["url"] == "http://example.com/"
+
+
 def test_scan_json_file(tmp_path):
     cfg_file = tmp_path / "config.yaml"
     cfg_file.write_text(
@@ -185,3 +202,40 @@ def test_scan_timeout(monkeypatch, tmp_path):
     result = runner.invoke(cli, ["--config", str(cfg_file), "scan", "--scan-timeout", "1"])
     assert result.exit_code != 0
     assert "не завершено" in result.output
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_dump_json_handles_models(monkeypatch, fast):
+    from dataclasses import dataclass
+
+    from site_scout.config import LocaleConfig
+
+    @dataclass
+    class Page:
+        url: str
+        tags: set
+
+    if not fast:
+        monkeypatch.setattr(cli_module, "orjson", None)
+    data = [Page("http://example.com/日本", {"a"}), LocaleConfig(subdomain="jp", path_prefix="/jp")]
+    decoded = json.loads(cli_module._dump_json(data))
+    assert decoded[0] == {"url": "http://example.com/日本", "tags": ["a"]}
+    assert decoded[1]["subdomain"] == "jp" and decoded[1]["hreflangs"] == []
+
+
+@pytest.mark.parametrize("fast", [True, False])
+@pytest.mark.parametrize("data", [[], [{"a": [1, {"b": "x\ny"}]}, "s", {}], {"k": 1}])
+def test_iter_json_matches_dump_json(monkeypatch, fast, data):
+    if not fast:
+        monkeypatch.setattr(cli_module, "orjson", None)
+    assert b"".join(cli_module._iter_json(data)) == cli_module._dump_json(data)
+
+
+def test_load_yaml_json_uses_config_reader(tmp_path):
+    cfg_file = tmp_path / "cfg.yaml"
+    cfg_file.write_text("max_depth: 2\nwordlists: {}\n", encoding="utf-8")
+    data = cli_module._load_yaml_json(cfg_file)
+    assert data == {"max_depth": 2, "wordlists": {}}
+    data["base_url"] = "http://example.com"
+    assert "base_url" not in cli_module._load_yaml_json(cfg_file)
+    assert cli_module._load_yaml_json(tmp_path / "missing.yaml") == {}
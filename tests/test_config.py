@@ -1,5 +1,6 @@
 # File: tests/test_config.py
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -55,3 +56,139 @@ def test_wordlists_file_not_found(tmp_path):
     )
     with pytest.raises(FileNotFoundError):
         load_config(cfg_path)
+
+
+def test_yaml_json_cache_refreshed_on_change(tmp_path):
+    cfg_path = write_file(tmp_path, "base_url: http://example.com\nwordlists: {}", ".yaml")
+    cache = tmp_path / "config.yaml.cache.json"
+
+    assert load_config(cfg_path).max_depth == 3
+    cached = json.loads(cache.read_text(encoding="utf-8"))
+    assert cached["data"]["base_url"] == "http://example.com"
+    assert load_config(cfg_path).max_depth == 3
+
+    cfg_path.write_text("base_url: http://example.com\nwordlists: {}\nmax_depth: 5")
+    os.utime(cfg_path, ns=(cache.stat().st_mtime_ns + 10**9,) * 2)
+    assert load_config(cfg_path).max_depth == 5
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_yaml_json_cache_ignored_for_restored_older_file(tmp_path):
+    cfg_path = write_file(tmp_path, "base_url: http://example.com\nwordlists: {}", ".yaml")
+    cache = tmp_path / "config.yaml.cache.json"
+    assert load_config(cfg_path).max_depth == 3
+
+    # как после `cp -p`: содержимое другое, mtime старше кэша
+    cfg_path.write_text("base_url: http://example.com\nwordlists: {}\nmax_depth: 7")
+    os.utime(cfg_path, ns=(cache.stat().st_mtime_ns - 10**9,) * 2)
+    assert load_config(cfg_path).max_depth == 7
+
+
+def test_base_url_is_validated_and_stripped(tmp_path):
+    data = {"base_url": "http://example.com/", "wordlists": {}}
+    cfg = load_config(write_file(tmp_path, json.dumps(data), ".json"))
+    assert cfg.base_url == "http://example.com"
+    assert json.loads(cfg.model_dump_json())["base_url"] == "http://example.com"
+    for bad in ("ftp://example.com", "example.com", "http://", "http://exa mple.com"):
+        with pytest.raises(ValidationError):
+            ScannerConfig(base_url=bad, wordlists={})
+
+
+def test_load_config_cached_until_file_changes(tmp_path):
+    cfg_path = write_file(
+        tmp_path, json.dumps({"base_url": "http://a.com", "wordlists": {}}), ".json"
+    )
+    from site_scout import config as config_module
+
+    first = load_config(cfg_path)
+    assert load_config(cfg_path) == first
+    assert config_module._load_config_cached.cache_info().hits == 1
+
+    cfg_path.write_text(json.dumps({"base_url": "http://b.com", "wordlists": {}}))
+    os.utime(cfg_path, ns=(cfg_path.stat().st_mtime_ns + 10**9,) * 2)
+    assert load_config(cfg_path).base_url == "http://b.com"
+
+
+def test_config_rewritten_after_stat_is_not_cached_under_old_stamp(tmp_path, monkeypatch):
+    from site_scout import config as config_module
+
+    cfg_path = write_file(
+        tmp_path, json.dumps({"base_url": "http://a.com", "wordlists": {}}), ".json"
+    )
+    real_stat = os.stat
+    old = real_stat(cfg_path)
+
+    def stat_then_rewrite(path, *args, **kwargs):
+        # Файл переписывают сразу после stat в load_config.
+        monkeypatch.setattr(os, "stat", real_stat)
+        st = real_stat(path, *args, **kwargs)
+        cfg_path.write_text(json.dumps({"base_url": "http://b.com", "wordlists": {}}))
+        os.utime(cfg_path, ns=(old.st_mtime_ns + 10**9,) * 2)
+        return st
+
+    monkeypatch.setattr(os, "stat", stat_then_rewrite)
+    assert load_config(cfg_path).base_url == "http://b.com"
+    with pytest.raises(config_module._StaleStamp):
+        config_module._load_config_cached(cfg_path.resolve(), old.st_size, old.st_mtime_ns)
+
+
+def test_touched_config_reuses_validated_instance(tmp_path):
+    from site_scout import config as config_module
+
+    cfg_path = write_file(tmp_path, "base_url: http://example.com\nwordlists: {}", ".yaml")
+    first = load_config(cfg_path)
+    key = str(cfg_path.resolve())
+    validated = config_module._LOADED_BY_DIGEST[key][1]
+    os.utime(cfg_path, ns=(cfg_path.stat().st_mtime_ns + 10**9,) * 2)
+    assert load_config(cfg_path) == first
+    assert config_module._LOADED_BY_DIGEST[key][1] is validated
+
+    trusted = ScannerConfig.from_trusted(first.model_dump())
+    assert trusted == first
+
+
+def test_cached_config_containers_are_not_shared(tmp_path):
+    wordlist = tmp_path / "w.txt"
+    wordlist.touch()
+    cfg_path = write_file(
+        tmp_path,
+        f"base_url: http://a.com\nwordlists: {{p: {wordlist}}}\n"
+        "localization: {jp: {subdomain: jp, path_prefix: /jp}}",
+        ".yaml",
+    )
+    first = load_config(cfg_path)
+    first.wordlists["extra"] = "x.txt"
+    first.localization["jp"].hreflangs.append("ja")
+
+    second = load_config(cfg_path)
+    assert second.wordlists == {"p": str(wordlist)}
+    assert second.localization["jp"].hreflangs == []
+
+
+def test_digest_cache_is_bounded(tmp_path):
+    from site_scout import config as config_module
+
+    for i in range(config_module._CONFIG_CACHE_SIZE + 3):
+        path = tmp_path / f"c{i}.json"
+        path.write_text(json.dumps({"base_url": f"http://h{i}.com", "wordlists": {}}))
+        load_config(path)
+    assert len(config_module._LOADED_BY_DIGEST) <= config_module._CONFIG_CACHE_SIZE
+    assert str(path.resolve()) in config_module._LOADED_BY_DIGEST
+
+
+def test_deleted_wordlist_detected_after_clear_caches(tmp_path):
+    from site_scout.config import clear_caches
+
+    wordlist = tmp_path / "w.txt"
+    wordlist.touch()
+    cfg_path = write_file(
+        tmp_path, f"base_url: http://a.com\nwordlists: {{p: {wordlist}}}", ".yaml"
+    )
+    load_config(cfg_path)
+    wordlist.unlink()
+
+    clear_caches()
+    with pytest.raises(FileNotFoundError):
+        load_config(cfg_path)
+    with pytest.raises(FileNotFoundError):
+        ScannerConfig(base_url="http://a.com", wordlists={"p": str(wordlist)})
@@ -371,3 +371,168 @@ async def test_retry_on_server_error(empty_wordlists, unused_tcp_port: int):
     urls = {normalize_url(p.url) for p in pages}
     assert normalize_url(f"{base}/flaky") in urls
     assert call_count["n"] == 3
+
+
+@pytest.mark.asyncio()
+async def test_binary_body_over_limit_is_dropped(empty_wordlists, unused_tcp_port: int):
+    app = web.Application()
+
+    async def root(_):
+        return web.Response(
+            text='<a href="/small.bin">S</a><a href="/big.bin">B</a>', content_type="text/html"
+        )
+
+    async def small(_):
+        return web.Response(body=b"x" * 50, content_type="application/octet-stream")
+
+    async def big(_):
+        return web.Response(body=b"x" * 300, content_type="application/octet-stream")
+
+    app.router.add_get("/", root)
+    app.router.add_get("/small.bin", small)
+    app.router.add_get("/big.bin", big)
+
+    async for base in _serve_app(app, unused_tcp_port):
+        config = ScannerConfig(
+            base_url=base,
+            max_depth=1,
+            timeout=2.0,
+            user_agent="TestAgent/1.0",
+            rate_limit=10.0,
+            wordlists=empty_wordlists,
+            max_download_bytes=100,
+        )
+        pages = await run_crawler(config, expected_pages=3)
+
+    bodies = {urlsplit(p.url).path: p.content for p in pages}
+    assert bodies["/small.bin"] == b"x" * 50
+    assert bodies["/big.bin"] == b""
+
+
+def test_extract_links_keeps_same_host_http_links(mock_page_data):
+    from site_scout.crawler.link_extractor import extract_links
+
+    mock_page_data.content += (
+        '<a href="mailto:a@example.com">M</a><a href="javascript:void(0)">J</a>'
+        '<a href=" /link2 ">L2</a><a name="anchor">no href</a><abbr href="/abbr">A</abbr>'
+        "<A class='x' HREF='/link3'>L3</A><a href=/link4>L4</a><a href=\"/q?a=1&amp;b=2\">Q</a>"
+        '<a data-href="/tracking" href="/real">R</a><a title="1 > 0" href="/x">X</a>'
+        '<!-- <a href="/commented">C</a> --><a title="see href=/fake">no link</a>'
+        "<script>var s = '<a href=\"/in-script\">';</script><style>a{}</style>"
+    )
+    assert extract_links(mock_page_data) == [
+        "http://example.com/link1",
+        "http://example.com/link2",
+        "http://example.com/link3",
+        "http://example.com/link4",
+        "http://example.com/q?a=1&b=2",
+        "http://example.com/real",
+        "http://example.com/x",
+    ]
+
+
+def test_extract_links_skips_unclosed_script(mock_page_data):
+    from site_scout.crawler.link_extractor import extract_links
+
+    mock_page_data.content += "<script>var s = '<a href=\"/in-script\">';"
+    assert extract_links(mock_page_data) == ["http://example.com/link1"]
+
+
+def test_extract_links_many_unclosed_tags_is_linear(mock_page_data):
+    from site_scout.crawler.link_extractor import extract_links
+
+    mock_page_data.content += "<script>" * 20_000 + '<a href="/after">A</a>' + "<!--" * 20_000
+    started = time.perf_counter()
+    assert extract_links(mock_page_data) == ["http://example.com/link1"]
+    # Квадратичный разбор занимал бы десятки секунд.
+    assert time.perf_counter() - started < 1.0
+
+
+def test_next_level_dedupes_links_and_stops_at_max_pages(basic_config, mock_page_data):
+    from site_scout.crawler.robots import RobotsTxtRules
+
+    crawler = AsyncCrawler(basic_config.model_copy(update={"max_pages": 4}))
+    crawler.robots = RobotsTxtRules("User-agent: *\nDisallow: /private")
+    links = [f"http://example.com/{name}" for name in ("a", "a/", "private", "b", "c", "d")]
+    visited = {"http://example.com"}
+
+    next_level = crawler._get_next_level([(mock_page_data, links)], visited)
+    assert [url for url, _ in next_level] == ["http://example.com/a", "http://example.com/b"]
+    assert visited == {"http://example.com", "http://example.com/a", "http://example.com/b"}
+
+
+@pytest.mark.asyncio()
+async def test_connections_per_host_are_bounded(empty_wordlists, unused_tcp_port, monkeypatch):
+    monkeypatch.setattr(AsyncCrawler, "_MAX_CONNECTIONS_PER_HOST", 2)
+    app = web.Application()
+    stats = {"in_flight": 0, "peak": 0}
+
+    async def root(_):
+        links = "".join(f'<a href="/p{i}">P</a>' for i in range(6))
+        return web.Response(text=links, content_type="text/html")
+
+    async def page(_):
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        await asyncio.sleep(0.05)
+        stats["in_flight"] -= 1
+        return web.Response(text="<h1>P</h1>", content_type="text/html")
+
+    app.router.add_get("/", root)
+    app.router.add_get("/p{i}", page)
+
+    async for base in _serve_app(app, unused_tcp_port):
+        config = ScannerConfig(
+            base_url=base,
+            max_depth=1,
+            timeout=0.2,
+            user_agent="TestAgent/1.0",
+            wordlists=empty_wordlists,
+        )
+        pages = await run_crawler(config, expected_pages=7)
+
+    assert len(pages) == 7
+    assert stats["peak"] == 2
+
+
+@pytest.mark.asyncio()
+async def test_retry_backoff_does_not_hold_connection_slot(
+    empty_wordlists, unused_tcp_port, monkeypatch
+):
+    monkeypatch.setattr(AsyncCrawler, "_MAX_CONNECTIONS_PER_HOST", 1)
+    app = web.Application()
+    seen: dict[str, float] = {}
+
+    async def root(_):
+        return web.Response(
+            text='<a href="/flaky">F</a><a href="/ok">O</a>', content_type="text/html"
+        )
+
+    async def flaky(_):
+        if "flaky" not in seen:
+            seen["flaky"] = time.perf_counter()
+            return web.Response(status=500)
+        return web.Response(text="<h1>F</h1>", content_type="text/html")
+
+    async def ok(_):
+        seen["ok"] = time.perf_counter()
+        return web.Response(text="<h1>O</h1>", content_type="text/html")
+
+    app.router.add_get("/", root)
+    app.router.add_get("/flaky", flaky)
+    app.router.add_get("/ok", ok)
+
+    async for base in _serve_app(app, unused_tcp_port):
+        config = ScannerConfig(
+            base_url=base,
+            max_depth=1,
+            timeout=5.0,
+            user_agent="TestAgent/1.0",
+            wordlists=empty_wordlists,
+            retry_times=1,
+        )
+        pages = await run_crawler(config, expected_pages=3)
+
+    assert len(pages) == 3
+    # /ok загружается во время паузы backoff, а не после неё (~2 с)
+    assert seen["ok"] - seen["flaky"] < 1.0
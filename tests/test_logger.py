@@ -0,0 +1,75 @@
+# File: tests/test_logger.py
+"""Тесты ленивой настройки логгера SiteScout."""
+import logging
+import threading
+import time
+
+import pytest
+
+from site_scout import logger as logger_module
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture()
+def project_logger(monkeypatch, tmp_path):
+    """Project logger reset to the lazy placeholder; restored afterwards."""
+    monkeypatch.chdir(tmp_path)
+    lg = logging.getLogger("SiteScout")
+    saved = lg.handlers[:]
+    lg.handlers = [logger_module._DeferredSetupHandler()]
+    yield lg
+    lg.handlers = saved
+
+
+def test_placeholder_keeps_caller_handlers(project_logger, tmp_path):
+    handler = _ListHandler()
+    project_logger.addHandler(handler)
+    project_logger.info("first")
+    project_logger.info("second")
+
+    assert handler.messages == ["first", "second"]
+    assert handler in project_logger.handlers
+    assert not any(
+        isinstance(h, logger_module._DeferredSetupHandler) for h in project_logger.handlers
+    )
+    assert not (tmp_path / "site_scout.log").exists()
+
+
+def test_configure_removes_placeholder(project_logger):
+    logger_module.configure(replace_handlers=False, queued=False)
+    assert not any(
+        isinstance(h, logger_module._DeferredSetupHandler) for h in project_logger.handlers
+    )
+
+
+def test_concurrent_first_records_are_not_lost(project_logger, monkeypatch):
+    handler = _ListHandler()
+
+    def slow_init_logging(level: str) -> None:
+        time.sleep(0.05)  # остальные потоки успевают упереться в placeholder
+        project_logger.handlers = [handler]  # как configure(): одна подмена списка
+
+    monkeypatch.setattr(logger_module, "init_logging", slow_init_logging)
+    # Только placeholder: обработчики pytest не должны принимать записи вместо него.
+    project_logger.handlers = [logger_module._DeferredSetupHandler()]
+    barrier = threading.Barrier(8)
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        project_logger.info("record %d", n)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(handler.messages) == sorted(f"record {n}" for n in range(8))